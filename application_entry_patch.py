@@ -9,6 +9,7 @@ ensuring a smooth user experience when running on pre-release macOS builds.
 
 import os
 import re
+import ast
 import sys
 import logging
 import shutil
@@ -26,6 +27,9 @@ class ApplicationEntryPatcher:
     Patches the application_entry.py file to better handle macOS beta versions
     """
     
+    # Pattern for the OS version detection call, compiled once with the class
+    _OS_VERSION_PATTERN = re.compile(r'(self\.constants\.detected_os_version = os_data\.detect_os_version\(\))')
+    
     def __init__(self, file_path):
         """
         Initialize the patcher with the path to application_entry.py
@@ -36,6 +40,9 @@ class ApplicationEntryPatcher:
         self.file_path = file_path
         self.backup_path = f"{file_path}.{datetime.now().strftime('%Y%m%d%H%M%S')}.bak"
         self.content = None
+        self.edits = []
+        self.nodes = {}
+        self.line_offsets = []
         
     def read_file(self):
         """
@@ -52,6 +59,55 @@ class ApplicationEntryPatcher:
             logging.error(f"Failed to read file: {e}")
             return False
             
+    def parse_content(self):
+        """
+        Parse the loaded content once and locate the patch targets
+        
+        The OpenCoreLegacyPatcher class, its __init__ and _generate_base_data
+        methods and the module-level main() are looked up structurally, so
+        the patch steps only search inside the relevant node.
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            tree = ast.parse(self.content)
+        except SyntaxError as e:
+            logging.error(f"Failed to parse file: {e}")
+            return False
+            
+        # Character offset of the start of each line, indexed by lineno - 1
+        self.line_offsets = [0]
+        for line in self.content.split("\n"):
+            self.line_offsets.append(self.line_offsets[-1] + len(line) + 1)
+            
+        self.nodes = {}
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and node.name == "OpenCoreLegacyPatcher":
+                self.nodes["class"] = node
+                for item in node.body:
+                    if isinstance(item, ast.FunctionDef) and item.name in ("__init__", "_generate_base_data"):
+                        self.nodes[item.name] = item
+            elif isinstance(node, ast.FunctionDef) and node.name == "main":
+                self.nodes["main"] = node
+                
+        return True
+        
+    def node_span(self, name):
+        """
+        Get the character span of a located node
+        
+        Parameters:
+            name (str): Key of the node in self.nodes
+        
+        Returns:
+            tuple: (start, end) offsets, or None if the node was not found
+        """
+        node = self.nodes.get(name)
+        if node is None:
+            return None
+        return self.line_offsets[node.lineno - 1], self.line_offsets[node.end_lineno]
+        
     def backup_file(self):
         """
         Create a backup of the original file
@@ -60,7 +116,13 @@ class ApplicationEntryPatcher:
             bool: True if successful, False otherwise
         """
         try:
-            shutil.copy2(self.file_path, self.backup_path)
+            # Hard link the original when possible; write_patched_file replaces
+            # the file rather than rewriting it in place, so the link keeps the
+            # original content. Fall back to a full copy across filesystems.
+            try:
+                os.link(self.file_path, self.backup_path)
+            except OSError:
+                shutil.copy2(self.file_path, self.backup_path)
             logging.info(f"Backup created at: {self.backup_path}")
             return True
         except Exception as e:
@@ -78,17 +140,14 @@ class ApplicationEntryPatcher:
             logging.error("No file content loaded")
             return False
             
-        # Find the _generate_base_data method
-        pattern = r'(def _generate_base_data\(self\).*?)(# Generate computer data)'
-        match = re.search(pattern, self.content, re.DOTALL)
+        # Find the computer data section of the _generate_base_data method
+        span = self.node_span("_generate_base_data")
+        position = self.content.find("# Generate computer data", *span) if span else -1
         
-        if not match:
+        if position == -1:
             logging.error("Could not find _generate_base_data method")
             return False
             
-        original_method_start = match.group(1)
-        after_method = match.group(2)
-        
         # Create the patched method with beta version handling
         beta_handler = """
         # Enhanced macOS Beta version handling (SkyScope patch)
@@ -96,20 +155,13 @@ class ApplicationEntryPatcher:
             logging.info(f"Detected macOS Beta version: {self.constants.detected_os_version}")
             # Set OS version for compatibility with beta releases
             if self.constants.detected_os_build.startswith("26"):
-                beta_version = 26.0  # Default to 26.0 for all beta versions
-                
-                # More specific beta version handling
-                if "26.3" in self.constants.detected_os_version:
-                    beta_version = 26.3
-                    logging.info("Setting compatibility for macOS Beta 3")
-                elif "26.2" in self.constants.detected_os_version:
-                    beta_version = 26.2
-                    logging.info("Setting compatibility for macOS Beta 2")
-                elif "26.1" in self.constants.detected_os_version:
-                    beta_version = 26.1
-                    logging.info("Setting compatibility for macOS Beta 1")
-                else:
-                    logging.info("Setting compatibility for macOS Beta")
+                # More specific beta version handling, defaulting to 26.0
+                beta_version = next(
+                    (version for marker, version in _SKYSCOPE_BETA_VERSIONS.items()
+                     if marker in self.constants.detected_os_version),
+                    26.0
+                )
+                logging.info(f"Setting compatibility for macOS Beta ({beta_version})")
                 
                 # Ensure we have proper support in constants
                 from .datasets import os_data
@@ -128,9 +180,21 @@ class ApplicationEntryPatcher:
 
         """
         
+        # Beta version lookup table, defined once at module level in the target
+        beta_versions = """# macOS beta version markers and their compatibility versions (SkyScope patch)
+_SKYSCOPE_BETA_VERSIONS = {"26.3": 26.3, "26.2": 26.2, "26.1": 26.1}
+
+
+"""
+        
+        class_span = self.node_span("class")
+        if not class_span:
+            logging.error("Could not find OpenCoreLegacyPatcher class")
+            return False
+        
         # Insert the beta handler after OS detection but before computer data generation
-        patched_method = original_method_start + beta_handler + after_method
-        self.content = self.content.replace(match.group(0), patched_method)
+        self.edits.append((class_span[0], class_span[0], beta_versions))
+        self.edits.append((position, position, beta_handler))
         
         return True
         
@@ -145,17 +209,14 @@ class ApplicationEntryPatcher:
             logging.error("No file content loaded")
             return False
             
-        # Find the __init__ method
-        pattern = r'(def __init__\(self\).*?)(self._generate_base_data\(\))'
-        match = re.search(pattern, self.content, re.DOTALL)
+        # Find the _generate_base_data call in the __init__ method
+        span = self.node_span("__init__")
+        position = self.content.find("self._generate_base_data()", *span) if span else -1
         
-        if not match:
+        if position == -1:
             logging.error("Could not find __init__ method")
             return False
             
-        original_init = match.group(1)
-        generate_base_data_call = match.group(2)
-        
         # Add beta version flag
         beta_flag = """
         # Flag for beta version detection (SkyScope patch)
@@ -164,8 +225,7 @@ class ApplicationEntryPatcher:
         """
         
         # Insert the beta flag before _generate_base_data call
-        patched_init = original_init + beta_flag + generate_base_data_call
-        self.content = self.content.replace(match.group(0), patched_init)
+        self.edits.append((position, position, beta_flag))
         
         return True
         
@@ -180,19 +240,16 @@ class ApplicationEntryPatcher:
             logging.error("No file content loaded")
             return False
             
-        # Find the OpenCoreLegacyPatcher class
-        pattern = r'(class OpenCoreLegacyPatcher:.*?)(def main\(\):)'
-        match = re.search(pattern, self.content, re.DOTALL)
+        # Find the OpenCoreLegacyPatcher class and the main() that follows it
+        class_span = self.node_span("class")
+        main_span = self.node_span("main")
         
-        if not match:
+        if not class_span or not main_span or main_span[0] < class_span[1]:
             logging.error("Could not find OpenCoreLegacyPatcher class")
             return False
             
-        class_content = match.group(1)
-        main_function = match.group(2)
-        
         # Create the helper method
-        helper_method = """
+        helper_method = '''
     def _handle_beta_compatibility(self) -> None:
         """
         Special handler for macOS beta versions to ensure compatibility
@@ -224,11 +281,10 @@ class ApplicationEntryPatcher:
                 logging.info(f"Added {self.constants.detected_os} to legacy acceleration support")
 
 
-"""
+'''
         
-        # Add the helper method to the class
-        patched_class = class_content + helper_method + main_function
-        self.content = self.content.replace(match.group(0), patched_class)
+        # Add the helper method to the end of the class, before main()
+        self.edits.append((main_span[0], main_span[0], helper_method))
         
         return True
         
@@ -244,8 +300,6 @@ class ApplicationEntryPatcher:
             return False
             
         # Find where we detect OS version and add the beta handler call
-        pattern = r'(self\.constants\.detected_os_version = os_data\.detect_os_version\(\))'
-        
         beta_handler_call = """
         self.constants.detected_os_version = os_data.detect_os_version()
         
@@ -255,7 +309,34 @@ class ApplicationEntryPatcher:
         """
         
         # Replace the OS version detection with our enhanced version
-        self.content = re.sub(pattern, beta_handler_call, self.content)
+        for match in self._OS_VERSION_PATTERN.finditer(self.content):
+            self.edits.append((match.start(), match.end(), beta_handler_call))
+        
+        return True
+        
+    def apply_edits(self):
+        """
+        Apply all queued edits to the loaded content in a single pass
+        
+        Edits are recorded against the original content as
+        (start, end, replacement) tuples so the file is rebuilt only once.
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        chunks = []
+        position = 0
+        for start, end, replacement in sorted(self.edits, key=lambda edit: edit[0]):
+            if start < position:
+                logging.error("Overlapping patch edits, refusing to apply")
+                return False
+            chunks.append(self.content[position:start])
+            chunks.append(replacement)
+            position = end
+        chunks.append(self.content[position:])
+        
+        self.content = "".join(chunks)
+        self.edits = []
         
         return True
         
@@ -266,9 +347,14 @@ class ApplicationEntryPatcher:
         Returns:
             bool: True if successful, False otherwise
         """
+        temp_path = f"{self.file_path}.tmp"
         try:
-            with open(self.file_path, 'w') as f:
+            # Write alongside the original and swap it in, leaving the
+            # (possibly hard linked) backup untouched
+            with open(temp_path, 'w') as f:
                 f.write(self.content)
+            shutil.copymode(self.file_path, temp_path)
+            os.replace(temp_path, self.file_path)
             logging.info(f"Successfully wrote patched file to: {self.file_path}")
             return True
         except Exception as e:
@@ -286,7 +372,7 @@ class ApplicationEntryPatcher:
             logging.error(f"File not found: {self.file_path}")
             return False
             
-        if not self.read_file():
+        if not self.read_file() or not self.parse_content():
             return False
             
         if not self.backup_file():
@@ -297,6 +383,7 @@ class ApplicationEntryPatcher:
             self.add_beta_helper_method() and
             self.patch_generate_base_data() and
             self.update_generate_base_data_call() and
+            self.apply_edits() and
             self.write_patched_file()
         )
         
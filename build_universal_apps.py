@@ -23,27 +23,145 @@ Date: July 10, 2025
 import os
 import sys
 import json
+import hashlib
 import logging
 import subprocess
 import tempfile
+import time
 import shutil
 import platform
+import re
+import threading
+import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Union
 import argparse
+import functools
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('UniversalBuildSystem')
 
+# Static PyInstaller spec for the macOS app, parameterized through a JSON file
+SPEC_TEMPLATE = Path(__file__).resolve().parent / "scripts" / "templates" / "universal_app.spec"
+
+# Number of timestamped build output directories kept under dist/
+DIST_HISTORY = 5
+
+# Magic numbers of thin Mach-O binaries: 32/64-bit in both byte orders
+MACHO_THIN_MAGICS = frozenset((
+    b"\xfe\xed\xfa\xce", b"\xce\xfa\xed\xfe",
+    b"\xfe\xed\xfa\xcf", b"\xcf\xfa\xed\xfe",
+))
+
+# Magic number of universal (fat) Mach-O binaries
+MACHO_FAT_MAGIC = b"\xca\xfe\xba\xbe"
+
+def _macho_kind(path: Path) -> Optional[str]:
+    """Return "thin" or "fat" for Mach-O binaries, None for anything else"""
+    try:
+        with open(path, 'rb') as f:
+            magic = f.read(4)
+    except OSError:
+        return None
+    if magic in MACHO_THIN_MAGICS:
+        return "thin"
+    if magic == MACHO_FAT_MAGIC:
+        return "fat"
+    return None
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """shutil.which, resolved once per tool for the whole run"""
+    return shutil.which(name)
+
+@functools.lru_cache(maxsize=1)
+def _system() -> str:
+    """platform.system, looked up once"""
+    return platform.system()
+
+@functools.lru_cache(maxsize=1)
+def _machine() -> str:
+    """platform.machine, looked up once"""
+    return platform.machine()
+
+def _run(cmd: List[str], check: bool = False, **kwargs) -> subprocess.CompletedProcess:
+    """
+    Run a command whose output only matters if it fails
+    
+    Output goes to an anonymous temporary file rather than being held in
+    memory, and the end of it is read back as stderr only on a nonzero exit.
+    """
+    with tempfile.TemporaryFile() as output:
+        returncode = subprocess.run(cmd, stdout=output, stderr=subprocess.STDOUT, **kwargs).returncode
+        errors = ""
+        if returncode != 0:
+            output.seek(max(0, os.fstat(output.fileno()).st_size - 65536))
+            errors = output.read().decode(errors="replace")
+    
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr=errors)
+    return subprocess.CompletedProcess(cmd, returncode, stderr=errors)
+
+def _hash_file(path: Path) -> str:
+    """SHA-256 of a file, streamed through one reusable 1 MiB buffer"""
+    digest = hashlib.sha256()
+    buffer = bytearray(1024 * 1024)
+    view = memoryview(buffer)
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+def _link_or_copy(src: Path, dst: Path):
+    """Hard link src to dst, copying instead where linking isn't possible"""
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+@functools.lru_cache(maxsize=None)
+def _appimagetool_options(appimagetool: str) -> Tuple[str, ...]:
+    """Compression options supported by this appimagetool, read from its --help"""
+    env = dict(os.environ, APPIMAGE_EXTRACT_AND_RUN="1")
+    result = subprocess.run([appimagetool, "--help"], capture_output=True, text=True, env=env)
+    help_text = result.stdout + result.stderr
+    
+    options = []
+    if "--comp" in help_text:
+        options += ["--comp", "zstd"]
+    if "--mksquashfs-opt" in help_text:
+        # Compress on every core, with squashfs' largest block size
+        options += [
+            "--mksquashfs-opt", "-processors",
+            "--mksquashfs-opt", str(os.cpu_count() or 1),
+            "--mksquashfs-opt", "-b",
+            "--mksquashfs-opt", "1M",
+        ]
+    return tuple(options)
+
 class UniversalBuildSystem:
     """Expert 11: Cross-Platform Build Engineer Implementation"""
     
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, clean: bool = False, onefile: bool = False):
         self.project_root = project_root
+        self.clean = clean
+        # Windows/Linux executables are one-directory bundles unless onefile
+        # is requested; those start without unpacking to a temp dir first
+        self.onefile = onefile
         self.build_dir = project_root / "build"
-        self.dist_dir = project_root / "dist"
+        # Every run writes to its own dist/<timestamp>; dist/latest points
+        # at the most recent one
+        self.dist_root = project_root / "dist"
+        self.dist_dir = self.dist_root / datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
         self.resources_dir = project_root / "resources"
         self.version = "4.0.0"
         self.app_name = "Skyscope Ultimate Enhanced"
@@ -61,6 +179,9 @@ class UniversalBuildSystem:
             "bundle_id": "com.skyscope.ultimate.enhanced"
         }
         
+        # Platform builds run concurrently but share one Python environment
+        self._pip_lock = threading.Lock()
+        
         logger.info("Universal Build System: Initialized cross-platform build system")
         self._setup_build_environment()
     
@@ -68,17 +189,34 @@ class UniversalBuildSystem:
         """Setup build environment"""
         logger.info("Universal Build System: Setting up build environment...")
         
-        # Create build directories
+        # Create build directories; previous outputs are left in place and
+        # pruned by _publish_dist once this run has finished
         self.build_dir.mkdir(exist_ok=True)
-        self.dist_dir.mkdir(exist_ok=True)
-        
-        # Clean previous builds
-        if self.dist_dir.exists():
-            shutil.rmtree(self.dist_dir)
-        self.dist_dir.mkdir()
+        self.dist_dir.mkdir(parents=True, exist_ok=True)
         
         logger.info("Universal Build System: Build environment ready")
     
+    def _publish_dist(self):
+        """Point dist/latest at this run's outputs and prune older runs"""
+        latest = self.dist_root / "latest"
+        try:
+            # Swap the link atomically so readers never see it missing
+            temp_link = self.dist_root / ".latest.tmp"
+            if temp_link.is_symlink():
+                temp_link.unlink()
+            temp_link.symlink_to(self.dist_dir.name, target_is_directory=True)
+            os.replace(temp_link, latest)
+        except OSError as e:
+            logger.warning(f"Could not update {latest}: {e}")
+        
+        runs = sorted(
+            path for path in self.dist_root.iterdir()
+            if path.is_dir() and not path.is_symlink()
+            and re.fullmatch(r"\d{8}T\d{6}Z", path.name)
+        )
+        for old_run in runs[:-DIST_HISTORY]:
+            shutil.rmtree(old_run, ignore_errors=True)
+    
     def build_all_platforms(self, platforms: List[str] = None) -> Dict[str, Any]:
         """Build for all specified platforms"""
         if platforms is None:
@@ -86,30 +224,66 @@ class UniversalBuildSystem:
         
         logger.info(f"Universal Build System: Building for platforms: {platforms}")
         
+        builders = {
+            "macos": self.build_macos,
+            "windows": self.build_windows,
+            "linux": self.build_linux,
+        }
+        
         build_results = {}
         
-        for platform_name in platforms:
-            logger.info(f"Universal Build System: Building for {platform_name}...")
-            
-            try:
-                if platform_name == "macos":
-                    result = self.build_macos()
-                elif platform_name == "windows":
-                    result = self.build_windows()
-                elif platform_name == "linux":
-                    result = self.build_linux()
-                else:
+        # Each platform writes to its own outputs, so the pipelines overlap;
+        # the heavy lifting happens in subprocesses, so threads are enough
+        with ThreadPoolExecutor(max_workers=max(len(platforms), 1)) as executor:
+            futures = {}
+            for platform_name in platforms:
+                if platform_name not in builders:
                     logger.error(f"Unsupported platform: {platform_name}")
                     continue
                 
-                build_results[platform_name] = result
-                logger.info(f"Universal Build System: {platform_name} build completed")
-                
-            except Exception as e:
-                logger.error(f"Universal Build System: {platform_name} build failed: {e}")
-                build_results[platform_name] = {"success": False, "error": str(e)}
+                logger.info(f"Universal Build System: Building for {platform_name}...")
+                futures[executor.submit(builders[platform_name])] = platform_name
+            
+            for future in as_completed(futures):
+                platform_name = futures[future]
+                try:
+                    build_results[platform_name] = future.result()
+                    logger.info(f"Universal Build System: {platform_name} build completed")
+                    
+                except Exception as e:
+                    logger.error(f"Universal Build System: {platform_name} build failed: {e}")
+                    build_results[platform_name] = {"success": False, "error": str(e)}
+        
+        self._publish_dist()
         
-        return build_results
+        # Report in the requested order rather than completion order
+        return {name: build_results[name] for name in platforms if name in build_results}
+    
+    def _hash_outputs(self, outputs: List[Path]) -> Dict[str, str]:
+        """Checksum the file artifacts of a build while they are still in the page cache"""
+        files = [output for output in outputs if isinstance(output, Path) and output.is_file()]
+        with ThreadPoolExecutor(max_workers=max(len(files), 1)) as executor:
+            return dict(zip((str(path) for path in files), executor.map(_hash_file, files)))
+    
+    def _pyinstaller_dir(self, platform_name: str) -> Path:
+        """Per-platform PyInstaller work directory, so concurrent builds don't collide"""
+        return self.build_dir / f"pyinstaller-{platform_name}"
+    
+    def _pyinstaller_options(self, platform_name: str) -> List[str]:
+        """
+        Work directory options for a platform's PyInstaller run
+        
+        The work directory persists between runs so PyInstaller can reuse its
+        analysis and only redo what changed; clean discards it.
+        """
+        options = ["--workpath", str(self._pyinstaller_dir(platform_name) / "work")]
+        if self.clean:
+            options.append("--clean")
+        return options
+    
+    def _pyinstaller_env(self, platform_name: str) -> Dict[str, str]:
+        """Environment giving each platform's PyInstaller run its own cache"""
+        return dict(os.environ, PYINSTALLER_CONFIG_DIR=str(self._pyinstaller_dir(platform_name) / "config"))
     
     def build_macos(self) -> Dict[str, Any]:
         """Build macOS application"""
@@ -128,25 +302,36 @@ class UniversalBuildSystem:
             # Install dependencies
             self._install_macos_dependencies()
             
-            # Create .app bundle
-            app_bundle = self._create_macos_app_bundle()
+            # Create .app bundle; on Apple Silicon, build the x86_64 half of
+            # the universal binary at the same time
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                native_future = executor.submit(self._create_macos_app_bundle)
+                x86_future = None
+                if _machine() == "arm64":
+                    x86_future = executor.submit(self._create_macos_app_bundle, "x86_64")
+                app_bundle = native_future.result()
+                x86_bundle = x86_future.result() if x86_future else None
+            
             if app_bundle:
                 macos_result["outputs"].append(app_bundle)
             
-            # Create universal binary if on Apple Silicon
-            if platform.machine() == "arm64":
-                universal_bundle = self._create_universal_binary(app_bundle)
+            # Create universal binary if on Apple Silicon; when it exists it
+            # is the bundle that gets signed and shipped
+            ship_bundle = app_bundle
+            if app_bundle and x86_bundle:
+                universal_bundle = self._create_universal_binary(app_bundle, x86_bundle)
                 if universal_bundle:
                     macos_result["universal_binary"] = True
                     macos_result["outputs"].append(universal_bundle)
+                    ship_bundle = universal_bundle
             
             # Code sign if certificates available
-            signed_bundle = self._code_sign_macos_app(app_bundle)
+            signed_bundle = self._code_sign_macos_app(ship_bundle)
             if signed_bundle:
                 macos_result["code_signed"] = True
             
             # Create DMG
-            dmg_file = self._create_dmg(app_bundle)
+            dmg_file = self._create_dmg(ship_bundle)
             if dmg_file:
                 macos_result["outputs"].append(dmg_file)
             
@@ -156,6 +341,7 @@ class UniversalBuildSystem:
                 if notarized:
                     macos_result["notarized"] = True
             
+            macos_result["hashes"] = self._hash_outputs(macos_result["outputs"])
             macos_result["success"] = True
             logger.info("Universal Build System: macOS build completed successfully")
             
@@ -177,140 +363,115 @@ class UniversalBuildSystem:
             "tqdm"
         ]
         
-        for dep in dependencies:
+        self._pip_install_batch(dependencies)
+    
+    def _pip_install_batch(self, dependencies: List[str]):
+        """Install dependencies with a single pip run, falling back to one at a time"""
+        pip_cmd = [sys.executable, "-m", "pip", "install", "--disable-pip-version-check", "--no-input", "-q"]
+        
+        # Skip the install entirely when this exact set was already installed
+        # into this interpreter; the stamp holds the pip freeze from that run
+        key = hashlib.sha256(
+            "\n".join(sorted(dependencies) + [sys.executable, sys.version]).encode()
+        ).hexdigest()
+        stamp_file = self.build_dir / f".deps-{key[:16]}.stamp"
+        
+        with self._pip_lock:
+            if stamp_file.exists():
+                logger.info(f"Dependencies already installed: {', '.join(dependencies)}")
+                return
+            
             try:
-                subprocess.run([sys.executable, "-m", "pip", "install", dep], 
-                             check=True, capture_output=True)
-                logger.info(f"Installed {dep}")
+                # One resolver pass and one interpreter start for the whole set
+                _run(pip_cmd + dependencies, check=True)
+                logger.info(f"Installed {', '.join(dependencies)}")
+                
+                freeze = subprocess.run([sys.executable, "-m", "pip", "freeze"],
+                                        capture_output=True, text=True)
+                stamp_file.write_text(freeze.stdout)
+                return
             except subprocess.CalledProcessError as e:
-                logger.warning(f"Failed to install {dep}: {e}")
+                logger.warning(f"Batch install failed, retrying individually: {e}")
+            
+            # Retry one by one so a single bad package doesn't block the rest
+            for dep in dependencies:
+                try:
+                    _run(pip_cmd + [dep], check=True)
+                    logger.info(f"Installed {dep}")
+                except subprocess.CalledProcessError as e:
+                    logger.warning(f"Failed to install {dep}: {e}")
     
-    def _create_macos_app_bundle(self) -> Optional[Path]:
-        """Create macOS .app bundle"""
-        logger.info("Universal Build System: Creating macOS .app bundle...")
+    def _create_macos_app_bundle(self, target_arch: Optional[str] = None) -> Optional[Path]:
+        """Create macOS .app bundle, for the host architecture unless target_arch is given"""
+        logger.info(f"Universal Build System: Creating macOS .app bundle ({target_arch or 'native'})...")
+        
+        # Cross-architecture builds get their own spec variables, work and dist paths
+        build_key = f"macos-{target_arch}" if target_arch else "macos"
+        dist_path = self.dist_dir / target_arch if target_arch else self.dist_dir
         
         try:
-            # PyInstaller spec file content
-            spec_content = f'''
-# -*- mode: python ; coding: utf-8 -*-
-
-block_cipher = None
-
-a = Analysis(
-    ['{self.project_root / self.build_config["main_script"]}'],
-    pathex=['{self.project_root}'],
-    binaries=[],
-    datas=[
-        ('{self.resources_dir}', 'resources'),
-        ('{self.project_root / "OpenCore-Legacy-Patcher-main"}', 'OpenCore-Legacy-Patcher-main'),
-        ('{self.project_root / "config.json"}', '.'),
-        ('{self.project_root / "advanced_config.json"}', '.'),
-    ],
-    hiddenimports=[
-        'wx',
-        'wx.lib.agw.aui',
-        'wx.lib.scrolledpanel',
-        'plistlib',
-        'zipfile',
-        'tempfile',
-        'threading',
-        'json',
-        'logging',
-        'subprocess',
-        'pathlib',
-        'dataclasses',
-        'typing',
-    ],
-    hookspath=[],
-    hooksconfig={{}},
-    runtime_hooks=[],
-    excludes=[],
-    win_no_prefer_redirects=False,
-    win_private_assemblies=False,
-    cipher=block_cipher,
-    noarchive=False,
-)
-
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    [],
-    exclude_binaries=True,
-    name='{self.build_config["app_name"]}',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    console=False,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-)
-
-coll = COLLECT(
-    exe,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    name='{self.build_config["app_name"]}',
-)
-
-app = BUNDLE(
-    coll,
-    name='{self.build_config["app_name"]}.app',
-    icon='{self.resources_dir / "skyscope_icon.icns"}',
-    bundle_identifier='{self.build_config["bundle_id"]}',
-    version='{self.version}',
-    info_plist={{
-        'CFBundleName': '{self.build_config["app_name"]}',
-        'CFBundleDisplayName': '{self.build_config["app_name"]}',
-        'CFBundleVersion': '{self.version}',
-        'CFBundleShortVersionString': '{self.version}',
-        'CFBundleIdentifier': '{self.build_config["bundle_id"]}',
-        'CFBundleExecutable': '{self.build_config["app_name"]}',
-        'CFBundlePackageType': 'APPL',
-        'CFBundleSignature': 'SKYS',
-        'NSHighResolutionCapable': True,
-        'NSRequiresAquaSystemAppearance': False,
-        'LSMinimumSystemVersion': '10.15.0',
-        'NSHumanReadableCopyright': 'Copyright © 2025 {self.build_config["author"]}',
-        'CFBundleDocumentTypes': [
-            {{
-                'CFBundleTypeExtensions': ['ipsw'],
-                'CFBundleTypeName': 'macOS Installer',
-                'CFBundleTypeRole': 'Editor',
-                'LSHandlerRank': 'Owner'
-            }}
-        ]
-    }},
-)
-'''
+            # The spec itself is static; what varies goes in a sidecar file,
+            # so version bumps don't change the spec PyInstaller sees
+            spec_vars = {
+                "main_script": str(self.project_root / self.build_config["main_script"]),
+                "project_root": str(self.project_root),
+                "datas": [
+                    (str(self.resources_dir), "resources"),
+                    (str(self.project_root / "OpenCore-Legacy-Patcher-main"), "OpenCore-Legacy-Patcher-main"),
+                    (str(self.project_root / "config.json"), "."),
+                    (str(self.project_root / "advanced_config.json"), "."),
+                ],
+                "app_name": self.build_config["app_name"],
+                "target_arch": target_arch,
+                "icon": str(self.resources_dir / "skyscope_icon.icns"),
+                "bundle_id": self.build_config["bundle_id"],
+                "version": self.version,
+                "info_plist": {
+                    "CFBundleName": self.build_config["app_name"],
+                    "CFBundleDisplayName": self.build_config["app_name"],
+                    "CFBundleVersion": self.version,
+                    "CFBundleShortVersionString": self.version,
+                    "CFBundleIdentifier": self.build_config["bundle_id"],
+                    "CFBundleExecutable": self.build_config["app_name"],
+                    "CFBundlePackageType": "APPL",
+                    "CFBundleSignature": "SKYS",
+                    "NSHighResolutionCapable": True,
+                    "NSRequiresAquaSystemAppearance": False,
+                    "LSMinimumSystemVersion": "10.15.0",
+                    "NSHumanReadableCopyright": f"Copyright © 2025 {self.build_config['author']}",
+                    "CFBundleDocumentTypes": [
+                        {
+                            "CFBundleTypeExtensions": ["ipsw"],
+                            "CFBundleTypeName": "macOS Installer",
+                            "CFBundleTypeRole": "Editor",
+                            "LSHandlerRank": "Owner"
+                        }
+                    ]
+                },
+            }
+            
+            spec_vars_file = self.build_dir / f"spec_vars-{build_key}.json"
+            with open(spec_vars_file, 'w') as f:
+                json.dump(spec_vars, f, indent=2)
             
-            # Write spec file
-            spec_file = self.build_dir / f"{self.build_config['app_name']}.spec"
-            with open(spec_file, 'w') as f:
-                f.write(spec_content)
+            env = self._pyinstaller_env(build_key)
+            env["SKYSCOPE_SPEC_VARS"] = str(spec_vars_file)
             
             # Run PyInstaller
             cmd = [
                 "pyinstaller",
-                "--clean",
                 "--noconfirm",
-                str(spec_file)
+                "--distpath", str(dist_path),
+                *self._pyinstaller_options(build_key),
+                str(SPEC_TEMPLATE)
             ]
             
-            result = subprocess.run(cmd, cwd=self.project_root, capture_output=True, text=True)
+            result = _run(cmd, cwd=self.project_root, env=env)
             
             if result.returncode == 0:
-                app_bundle = self.dist_dir / f"{self.build_config['app_name']}.app"
+                app_bundle = dist_path / f"{self.build_config['app_name']}.app"
                 if app_bundle.exists():
+                    self._postprocess_bundle(app_bundle)
                     logger.info(f"macOS .app bundle created: {app_bundle}")
                     return app_bundle
             else:
@@ -321,15 +482,62 @@ app = BUNDLE(
         
         return None
     
-    def _create_universal_binary(self, app_bundle: Path) -> Optional[Path]:
-        """Create universal binary (Intel + Apple Silicon)"""
+    def _create_universal_binary(self, app_bundle: Path, x86_bundle: Path) -> Optional[Path]:
+        """Create universal binary (Intel + Apple Silicon) from two thin bundles"""
         logger.info("Universal Build System: Creating universal binary...")
         
         try:
-            # This would require building on both architectures and combining
-            # For now, we'll create a placeholder
             universal_bundle = self.dist_dir / f"{self.build_config['app_name']}_Universal.app"
-            shutil.copytree(app_bundle, universal_bundle)
+            if universal_bundle.exists():
+                shutil.rmtree(universal_bundle)
+            universal_bundle.mkdir()
+            
+            # Mirror the arm64 bundle: thin Mach-O pairs are merged with lipo,
+            # everything else is shared with the arm64 bundle where possible
+            merges = []
+            unmerged = []
+            for root, dirs, files in os.walk(app_bundle):
+                rel_root = Path(root).relative_to(app_bundle)
+                # The bundle seal no longer matches once binaries are merged
+                dirs[:] = [name for name in dirs if name != "_CodeSignature"]
+                
+                for name in dirs + files:
+                    src = Path(root) / name
+                    dst = universal_bundle / rel_root / name
+                    
+                    if src.is_symlink():
+                        dst.symlink_to(os.readlink(src))
+                    elif src.is_dir():
+                        dst.mkdir()
+                    else:
+                        kind = _macho_kind(src)
+                        x86_src = x86_bundle / rel_root / name
+                        if kind == "thin" and _macho_kind(x86_src) == "thin":
+                            merges.append((src, x86_src, dst))
+                        elif kind:
+                            # Copied, as code signing rewrites Mach-O files
+                            if kind == "thin":
+                                unmerged.append(rel_root / name)
+                            shutil.copy2(src, dst)
+                        else:
+                            _link_or_copy(src, dst)
+            
+            def lipo(merge):
+                arm64_path, x86_path, universal_path = merge
+                _run(
+                    ["lipo", "-create", str(arm64_path), str(x86_path), "-output", str(universal_path)],
+                    check=True
+                )
+            
+            if unmerged:
+                logger.warning(
+                    f"{len(unmerged)} arm64 binaries have no thin x86_64 counterpart "
+                    f"and stay arm64-only: {', '.join(str(path) for path in unmerged)}"
+                )
+            
+            logger.info(f"Merging {len(merges)} Mach-O binaries with lipo...")
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+                list(executor.map(lipo, merges))
             
             logger.info(f"Universal binary created: {universal_bundle}")
             return universal_bundle
@@ -338,52 +546,71 @@ app = BUNDLE(
             logger.error(f"Failed to create universal binary: {e}")
             return None
     
-    def _code_sign_macos_app(self, app_bundle: Path) -> bool:
-        """Code sign macOS application"""
-        logger.info("Universal Build System: Code signing macOS application...")
-        
-        try:
+    def _find_signing_identity(self) -> Optional[str]:
+        """Look up the Developer ID Application identity, once per build system"""
+        if not hasattr(self, "_signing_identity"):
+            self._signing_identity = None
+            
             # Check for signing identity
             result = subprocess.run(
                 ["security", "find-identity", "-v", "-p", "codesigning"],
                 capture_output=True, text=True
             )
             
-            if "Developer ID Application" not in result.stdout:
-                logger.warning("No Developer ID Application certificate found")
-                return False
-            
             # Extract identity
-            lines = result.stdout.split('\n')
-            identity = None
-            for line in lines:
-                if "Developer ID Application" in line:
-                    identity = line.split('"')[1]
+            for line in result.stdout.split('\n'):
+                if "Developer ID Application" in line and '"' in line:
+                    self._signing_identity = line.split('"')[1]
                     break
-            
+        
+        return self._signing_identity
+    
+    def _code_sign_macos_app(self, app_bundle: Path) -> bool:
+        """Code sign macOS application, signing nested code in parallel"""
+        logger.info("Universal Build System: Code signing macOS application...")
+        
+        try:
+            identity = self._find_signing_identity()
             if not identity:
-                logger.warning("Could not extract signing identity")
+                logger.warning("No Developer ID Application certificate found")
                 return False
             
-            # Sign the application
-            cmd = [
-                "codesign",
-                "--force",
-                "--verify",
-                "--verbose",
-                "--sign", identity,
-                "--deep",
-                str(app_bundle)
-            ]
+            def sign(path: Path):
+                _run(
+                    ["codesign", "--force", "--timestamp", "--options", "runtime",
+                     "--sign", identity, str(path)],
+                    check=True
+                )
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Find nested Mach-O files and bundles instead of relying on the
+            # deprecated, sequential --deep
+            binaries = []
+            bundles = []
+            for root, dirs, files in os.walk(app_bundle / "Contents"):
+                for name in dirs:
+                    if name.endswith((".framework", ".app")):
+                        bundles.append(Path(root) / name)
+                for name in files:
+                    path = Path(root) / name
+                    if not path.is_symlink() and _macho_kind(path):
+                        binaries.append(path)
             
-            if result.returncode == 0:
-                logger.info("macOS application code signed successfully")
-                return True
-            else:
-                logger.error(f"Code signing failed: {result.stderr}")
-                
+            # Leaf binaries are independent, so sign them concurrently
+            logger.info(f"Signing {len(binaries)} nested binaries...")
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+                list(executor.map(sign, binaries))
+            
+            # Nested bundles seal the code inside them, so sign inside out
+            for bundle in sorted(bundles, key=lambda path: len(path.parts), reverse=True):
+                sign(bundle)
+            
+            sign(app_bundle)
+            
+            logger.info("macOS application code signed successfully")
+            return True
+            
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Code signing failed: {e.stderr}")
         except Exception as e:
             logger.error(f"Code signing failed: {e}")
         
@@ -396,13 +623,23 @@ app = BUNDLE(
         try:
             dmg_file = self.dist_dir / f"{self.build_config['app_name']}_v{self.version}.dmg"
             
+            # Size the image from the bundle plus slack for filesystem
+            # metadata, rather than a fixed 500M image that has to be trimmed
+            bundle_bytes = sum(p.stat().st_size for p in app_bundle.rglob("*")
+                               if p.is_file() and not p.is_symlink())
+            dmg_size = f"{int(bundle_bytes * 1.10 / (1024 * 1024)) + 20}M"
+            
             # DMG build settings
             dmg_settings = {
                 'filename': str(dmg_file),
                 'volume_name': f"{self.build_config['app_name']} v{self.version}",
-                'format': 'UDBZ',
-                'size': '500M',
-                'files': [str(app_bundle)],
+                # LZFSE: faster to build and open than bzip2, needs 10.11+
+                # (the app requires 10.15)
+                'format': 'ULFO',
+                'size': dmg_size,
+                # Installed under the plain app name whichever bundle
+                # (thin or _Universal) is shipped
+                'files': [(str(app_bundle), f"{self.build_config['app_name']}.app")],
                 'symlinks': {'Applications': '/Applications'},
                 'icon_locations': {
                     f"{self.build_config['app_name']}.app": (100, 100),
@@ -431,14 +668,16 @@ app = BUNDLE(
             
             # Create DMG settings file
             dmg_settings_file = self.build_dir / 'dmg_settings.py'
+            # dmgbuild reads module-level names from the settings file
             with open(dmg_settings_file, 'w') as f:
-                f.write(f"settings = {dmg_settings}")
+                for key, value in dmg_settings.items():
+                    f.write(f"{key} = {value!r}\n")
             
             # Build DMG
             cmd = ["dmgbuild", "-s", str(dmg_settings_file), 
                    dmg_settings['volume_name'], str(dmg_file)]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = _run(cmd)
             
             if result.returncode == 0 and dmg_file.exists():
                 logger.info(f"DMG created: {dmg_file}")
@@ -467,21 +706,49 @@ app = BUNDLE(
         """Notarize macOS application"""
         logger.info("Universal Build System: Notarizing macOS application...")
         
+        profile = ["--keychain-profile", "skyscope-notarization", "--output-format", "json"]
+        
         try:
-            # Submit for notarization
-            cmd = [
-                "xcrun", "notarytool", "submit", str(dmg_file),
-                "--keychain-profile", "skyscope-notarization",
-                "--wait"
-            ]
+            # Submit for notarization without blocking in notarytool, so
+            # progress can be reported while Apple processes the upload
+            result = subprocess.run(
+                ["xcrun", "notarytool", "submit", str(dmg_file), *profile],
+                capture_output=True, text=True
+            )
+            if result.returncode != 0:
+                logger.error(f"Notarization failed: {result.stderr}")
+                return False
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            submission_id = json.loads(result.stdout)["id"]
+            logger.info(f"Notarization submitted: {submission_id}")
             
-            if result.returncode == 0:
-                logger.info("macOS application notarized successfully")
-                return True
-            else:
-                logger.error(f"Notarization failed: {result.stderr}")
+            # Poll until Apple reaches a verdict, giving up after an hour
+            status = "In Progress"
+            deadline = time.monotonic() + 3600
+            while status == "In Progress" and time.monotonic() < deadline:
+                time.sleep(30)
+                result = subprocess.run(
+                    ["xcrun", "notarytool", "info", submission_id, *profile],
+                    capture_output=True, text=True
+                )
+                if result.returncode == 0:
+                    status = json.loads(result.stdout).get("status", status)
+                    logger.info(f"Notarization status: {status}")
+                else:
+                    logger.warning(f"Could not query notarization status: {result.stderr}")
+            
+            if status != "Accepted":
+                logger.error(f"Notarization failed with status: {status}")
+                return False
+            
+            # Attach the ticket so the DMG verifies offline
+            result = _run(["xcrun", "stapler", "staple", str(dmg_file)])
+            if result.returncode != 0:
+                logger.error(f"Stapling failed: {result.stderr}")
+                return False
+            
+            logger.info("macOS application notarized successfully")
+            return True
                 
         except Exception as e:
             logger.error(f"Notarization failed: {e}")
@@ -506,14 +773,16 @@ app = BUNDLE(
             # Create .exe
             exe_file = self._create_windows_exe()
             if exe_file:
-                windows_result["outputs"].append(exe_file)
+                windows_result["outputs"] += self._executable_outputs(exe_file, "Windows")
             
             # Create MSI installer
-            msi_file = self._create_windows_msi(exe_file)
+            # Developer builds skip MSI validation; CI always runs it
+            msi_file = self._create_windows_msi(exe_file, fast=not os.environ.get("CI"))
             if msi_file:
                 windows_result["outputs"].append(msi_file)
                 windows_result["installer_created"] = True
             
+            windows_result["hashes"] = self._hash_outputs(windows_result["outputs"])
             windows_result["success"] = True
             logger.info("Universal Build System: Windows build completed successfully")
             
@@ -534,13 +803,7 @@ app = BUNDLE(
             "tqdm"
         ]
         
-        for dep in dependencies:
-            try:
-                subprocess.run([sys.executable, "-m", "pip", "install", dep], 
-                             check=True, capture_output=True)
-                logger.info(f"Installed {dep}")
-            except subprocess.CalledProcessError as e:
-                logger.warning(f"Failed to install {dep}: {e}")
+        self._pip_install_batch(dependencies)
     
     def _create_windows_exe(self) -> Optional[Path]:
         """Create Windows executable"""
@@ -550,8 +813,11 @@ app = BUNDLE(
             # PyInstaller command for Windows
             cmd = [
                 "pyinstaller",
-                "--onefile",
+                "--onefile" if self.onefile else "--onedir",
                 "--windowed",
+                "--distpath", str(self.dist_dir),
+                *self._pyinstaller_options("windows"),
+                "--specpath", str(self._pyinstaller_dir("windows")),
                 "--name", f"{self.build_config['app_name']}_v{self.version}",
                 "--icon", str(self.resources_dir / "skyscope_icon.ico") if (self.resources_dir / "skyscope_icon.ico").exists() else None,
                 "--add-data", f"{self.resources_dir};resources",
@@ -567,11 +833,17 @@ app = BUNDLE(
             # Remove None values
             cmd = [arg for arg in cmd if arg is not None]
             
-            result = subprocess.run(cmd, cwd=self.project_root, capture_output=True, text=True)
+            result = _run(cmd, cwd=self.project_root, env=self._pyinstaller_env("windows"))
             
             if result.returncode == 0:
-                exe_file = self.dist_dir / f"{self.build_config['app_name']}_v{self.version}.exe"
+                exe_name = f"{self.build_config['app_name']}_v{self.version}"
+                if self.onefile:
+                    exe_file = self.dist_dir / f"{exe_name}.exe"
+                else:
+                    exe_file = self.dist_dir / exe_name / f"{exe_name}.exe"
                 if exe_file.exists():
+                    if not self.onefile:
+                        self._postprocess_bundle(exe_file.parent)
                     logger.info(f"Windows executable created: {exe_file}")
                     return exe_file
             else:
@@ -582,19 +854,38 @@ app = BUNDLE(
         
         return None
     
-    def _create_windows_msi(self, exe_file: Path) -> Optional[Path]:
-        """Create Windows MSI installer"""
+    def _create_windows_msi(self, exe_file: Path, fast: bool = False) -> Optional[Path]:
+        """Create Windows MSI installer, skipping ICE validation if fast"""
         logger.info("Universal Build System: Creating Windows MSI installer...")
         
         try:
             # Check for WiX Toolset
-            wix_candle = shutil.which("candle.exe")
-            wix_light = shutil.which("light.exe")
+            wix_candle = _which("candle.exe")
+            wix_light = _which("light.exe")
             
-            if not wix_candle or not wix_light:
+            wix_heat = _which("heat.exe")
+            
+            if not wix_candle or not wix_light or (not self.onefile and not wix_heat):
                 logger.warning("WiX Toolset not found, skipping MSI creation")
                 return None
             
+            if self.onefile:
+                # A component's GUID must follow its install path, so upgrades
+                # can tell unchanged components apart and leave them in place
+                component_guid = uuid.uuid5(
+                    uuid.NAMESPACE_DNS,
+                    f"skyscope/{self.build_config['app_name']}/{exe_file.name}"
+                )
+                components = f'''
+        <ComponentGroup Id="ProductComponents" Directory="INSTALLFOLDER">
+            <Component Id="MainExecutable" Guid="{{{str(component_guid).upper()}}}">
+                <File Id="MainExe" Source="{exe_file}" KeyPath="yes" />
+            </Component>
+        </ComponentGroup>'''
+            else:
+                # ProductComponents comes from the fragment harvested below
+                components = ""
+            
             # Create WiX source file
             wxs_content = f'''<?xml version="1.0" encoding="UTF-8"?>
 <Wix xmlns="http://schemas.microsoft.com/wix/2006/wi">
@@ -616,12 +907,7 @@ app = BUNDLE(
                 <Directory Id="INSTALLFOLDER" Name="{self.build_config['app_name']}" />
             </Directory>
         </Directory>
-        
-        <ComponentGroup Id="ProductComponents" Directory="INSTALLFOLDER">
-            <Component Id="MainExecutable" Guid="{{87654321-4321-4321-4321-210987654321}}">
-                <File Id="MainExe" Source="{exe_file}" KeyPath="yes" />
-            </Component>
-        </ComponentGroup>
+        {components}
     </Product>
 </Wix>'''
             
@@ -629,20 +915,61 @@ app = BUNDLE(
             with open(wxs_file, 'w') as f:
                 f.write(wxs_content)
             
-            # Compile WiX source
-            wixobj_file = self.build_dir / f"{self.build_config['app_name']}.wixobj"
-            candle_cmd = [wix_candle, "-out", str(wixobj_file), str(wxs_file)]
+            wxs_files = [wxs_file]
+            candle_defines = []
             
-            result = subprocess.run(candle_cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                logger.error(f"WiX candle failed: {result.stderr}")
-                return None
+            if not self.onefile:
+                # Harvest the whole one-directory bundle; -ag leaves the
+                # component GUIDs to candle, which derives them from the paths
+                components_file = self.build_dir / f"{self.build_config['app_name']}-components.wxs"
+                heat_cmd = [
+                    wix_heat, "dir", str(exe_file.parent),
+                    "-cg", "ProductComponents",
+                    "-dr", "INSTALLFOLDER",
+                    "-ag", "-sfrag", "-srd",
+                    "-var", "var.SourceDir",
+                    "-out", str(components_file)
+                ]
+                
+                result = _run(heat_cmd)
+                if result.returncode != 0:
+                    logger.error(f"WiX heat failed: {result.stderr}")
+                    return None
+                
+                wxs_files.append(components_file)
+                candle_defines.append(f"-dSourceDir={exe_file.parent}")
             
-            # Link MSI
+            # Compile WiX sources; candle's output depends only on the source
+            # text and defines, so an object compiled from identical input
+            # is reused
+            wixobj_dir = self.build_dir / "wixobj"
+            wixobj_dir.mkdir(exist_ok=True)
+            
+            wixobj_files = []
+            for source_file in wxs_files:
+                digest = hashlib.sha256(source_file.read_bytes())
+                digest.update("\0".join(candle_defines).encode())
+                wixobj_file = wixobj_dir / f"{digest.hexdigest()}.wixobj"
+                
+                if not wixobj_file.exists():
+                    partial_file = wixobj_file.with_suffix(".partial")
+                    candle_cmd = [wix_candle, *candle_defines, "-out", str(partial_file), str(source_file)]
+                    
+                    result = _run(candle_cmd)
+                    if result.returncode != 0:
+                        logger.error(f"WiX candle failed: {result.stderr}")
+                        return None
+                    os.replace(partial_file, wixobj_file)
+                
+                wixobj_files.append(wixobj_file)
+            
+            # Link MSI; -sval skips ICE validation, light's slowest phase
             msi_file = self.dist_dir / f"{self.build_config['app_name']}_v{self.version}.msi"
-            light_cmd = [wix_light, "-out", str(msi_file), str(wixobj_file)]
+            light_cmd = [wix_light, "-out", str(msi_file), *map(str, wixobj_files)]
+            if fast:
+                light_cmd.append("-sval")
             
-            result = subprocess.run(light_cmd, capture_output=True, text=True)
+            result = _run(light_cmd)
             if result.returncode == 0 and msi_file.exists():
                 logger.info(f"Windows MSI created: {msi_file}")
                 return msi_file
@@ -672,7 +999,7 @@ app = BUNDLE(
             # Create executable
             exe_file = self._create_linux_executable()
             if exe_file:
-                linux_result["outputs"].append(exe_file)
+                linux_result["outputs"] += self._executable_outputs(exe_file, "Linux")
             
             # Create AppImage
             appimage_file = self._create_linux_appimage(exe_file)
@@ -680,6 +1007,7 @@ app = BUNDLE(
                 linux_result["outputs"].append(appimage_file)
                 linux_result["appimage_created"] = True
             
+            linux_result["hashes"] = self._hash_outputs(linux_result["outputs"])
             linux_result["success"] = True
             logger.info("Universal Build System: Linux build completed successfully")
             
@@ -700,13 +1028,7 @@ app = BUNDLE(
             "tqdm"
         ]
         
-        for dep in dependencies:
-            try:
-                subprocess.run([sys.executable, "-m", "pip", "install", dep], 
-                             check=True, capture_output=True)
-                logger.info(f"Installed {dep}")
-            except subprocess.CalledProcessError as e:
-                logger.warning(f"Failed to install {dep}: {e}")
+        self._pip_install_batch(dependencies)
     
     def _create_linux_executable(self) -> Optional[Path]:
         """Create Linux executable"""
@@ -716,7 +1038,11 @@ app = BUNDLE(
             # PyInstaller command for Linux
             cmd = [
                 "pyinstaller",
-                "--onefile",
+                "--onefile" if self.onefile else "--onedir",
+                "--strip",
+                "--distpath", str(self.dist_dir),
+                *self._pyinstaller_options("linux"),
+                "--specpath", str(self._pyinstaller_dir("linux")),
                 "--name", f"{self.build_config['app_name']}_v{self.version}",
                 "--add-data", f"{self.resources_dir}:resources",
                 "--add-data", f"{self.project_root / 'OpenCore-Legacy-Patcher-main'}:OpenCore-Legacy-Patcher-main",
@@ -728,11 +1054,17 @@ app = BUNDLE(
                 str(self.project_root / self.build_config["main_script"])
             ]
             
-            result = subprocess.run(cmd, cwd=self.project_root, capture_output=True, text=True)
+            result = _run(cmd, cwd=self.project_root, env=self._pyinstaller_env("linux"))
             
             if result.returncode == 0:
-                exe_file = self.dist_dir / f"{self.build_config['app_name']}_v{self.version}"
+                exe_name = f"{self.build_config['app_name']}_v{self.version}"
+                if self.onefile:
+                    exe_file = self.dist_dir / exe_name
+                else:
+                    exe_file = self.dist_dir / exe_name / exe_name
                 if exe_file.exists():
+                    if not self.onefile:
+                        self._postprocess_bundle(exe_file.parent)
                     logger.info(f"Linux executable created: {exe_file}")
                     return exe_file
             else:
@@ -749,7 +1081,7 @@ app = BUNDLE(
         
         try:
             # Check for appimagetool
-            appimagetool = shutil.which("appimagetool")
+            appimagetool = _which("appimagetool")
             if not appimagetool:
                 logger.warning("appimagetool not found, skipping AppImage creation")
                 return None
@@ -758,9 +1090,19 @@ app = BUNDLE(
             appdir = self.build_dir / f"{self.build_config['app_name']}.AppDir"
             appdir.mkdir(exist_ok=True)
             
-            # Copy executable
-            shutil.copy2(exe_file, appdir / "AppRun")
-            os.chmod(appdir / "AppRun", 0o755)
+            # Stage executable
+            app_run = appdir / "AppRun"
+            if self.onefile:
+                self._stage_appdir(exe_file, app_run)
+            else:
+                self._stage_appdir(exe_file.parent, appdir / "usr" / "bin")
+                if app_run.exists() or app_run.is_symlink():
+                    app_run.unlink()
+                app_run.write_text(f'''#!/bin/sh
+HERE="$(dirname "$(readlink -f "$0")")"
+exec "$HERE/usr/bin/{exe_file.name}" "$@"
+''')
+            os.chmod(app_run, 0o755)
             
             # Create desktop file
             desktop_content = f'''[Desktop Entry]
@@ -777,13 +1119,16 @@ Categories=Utility;System;
             # Copy icon if available
             icon_file = self.resources_dir / "skyscope_icon.png"
             if icon_file.exists():
-                shutil.copy2(icon_file, appdir / f"{self.build_config['app_name'].lower()}.png")
+                _link_or_copy(icon_file, appdir / f"{self.build_config['app_name'].lower()}.png")
             
             # Create AppImage
             appimage_file = self.dist_dir / f"{self.build_config['app_name']}_v{self.version}.AppImage"
             
-            cmd = [appimagetool, str(appdir), str(appimage_file)]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            cmd = [appimagetool, *_appimagetool_options(appimagetool), str(appdir), str(appimage_file)]
+            
+            # Let appimagetool run without FUSE (containers, CI)
+            env = dict(os.environ, APPIMAGE_EXTRACT_AND_RUN="1")
+            result = _run(cmd, env=env)
             
             if result.returncode == 0 and appimage_file.exists():
                 logger.info(f"Linux AppImage created: {appimage_file}")
@@ -796,11 +1141,88 @@ Categories=Utility;System;
         
         return None
     
+    def _executable_outputs(self, exe_file: Path, platform_name: str) -> List[Path]:
+        """
+        Release outputs for a PyInstaller executable
+        
+        A onefile executable is shipped as is. A onedir executable can't run
+        without the rest of its bundle directory, so the directory is recorded
+        and published as a zip archive instead of the bare executable.
+        """
+        if self.onefile:
+            return [exe_file]
+        
+        bundle_dir = exe_file.parent
+        archive = self._archive_bundle(bundle_dir, platform_name)
+        return [bundle_dir, archive] if archive else [bundle_dir]
+    
+    def _archive_bundle(self, bundle_dir: Path, platform_name: str) -> Optional[Path]:
+        """Zip a onedir bundle, keeping the bundle directory as the archive's top level"""
+        archive = self.dist_dir / f"{self.build_config['app_name']}_v{self.version}_{platform_name}.zip"
+        try:
+            with zipfile.ZipFile(archive, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+                for dirpath, dirnames, filenames in os.walk(bundle_dir):
+                    dirnames.sort()
+                    for name in sorted(filenames):
+                        path = Path(dirpath) / name
+                        # ZipFile.write keeps the mode bits, so the
+                        # executable stays executable when unpacked
+                        zf.write(path, path.relative_to(bundle_dir.parent))
+            logger.info(f"{platform_name} bundle archived: {archive}")
+            return archive
+        except OSError as e:
+            logger.error(f"Failed to archive {bundle_dir}: {e}")
+            return None
+    
+    def _postprocess_bundle(self, root: Path):
+        """
+        Trim a bundle directory before it is signed and packaged
+        
+        Data directories are collected as they are on disk, so bytecode
+        caches from local runs of the bundled sources ride along; they are
+        never used from the bundle and only feed the DMG/MSI/AppImage
+        compressor.
+        """
+        removed = 0
+        for dirpath, dirnames, _ in os.walk(root):
+            if "__pycache__" in dirnames:
+                dirnames.remove("__pycache__")
+                shutil.rmtree(Path(dirpath) / "__pycache__")
+                removed += 1
+        
+        if removed:
+            logger.info(f"Removed {removed} bytecode cache directories from {root.name}")
+    
+    def _stage_appdir(self, src: Path, dst: Path):
+        """
+        Stage a file or directory tree into the AppDir with hard links
+        
+        appimagetool only reads the AppDir, so sharing inodes with the
+        PyInstaller output is safe and avoids copying the payload.
+        """
+        if not src.is_dir():
+            _link_or_copy(src, dst)
+            return
+        
+        for root, dirs, files in os.walk(src):
+            rel_root = Path(root).relative_to(src)
+            (dst / rel_root).mkdir(parents=True, exist_ok=True)
+            for name in dirs + files:
+                src_path = Path(root) / name
+                dst_path = dst / rel_root / name
+                if src_path.is_symlink():
+                    if dst_path.is_symlink() or dst_path.exists():
+                        dst_path.unlink()
+                    dst_path.symlink_to(os.readlink(src_path))
+                elif name in files:
+                    _link_or_copy(src_path, dst_path)
+    
     def create_github_release_script(self, build_results: Dict[str, Any]) -> Path:
         """Create GitHub release automation script"""
         logger.info("Universal Build System: Creating GitHub release script...")
         
-        script_content = f'''#!/bin/bash
+        # Collect the script in pieces and join once at the end
+        script_parts = [f'''#!/bin/bash
 # GitHub Release Automation Script
 # Generated by Skyscope Universal Build System
 
@@ -823,28 +1245,48 @@ gh release create "v$VERSION" \\
 
 echo "Uploading release assets..."
 
-'''
+''']
         
         # Add upload commands for each platform
         for platform, result in build_results.items():
             if result.get("success") and result.get("outputs"):
                 for output_file in result["outputs"]:
-                    if isinstance(output_file, Path) and output_file.exists():
-                        script_content += f'''
+                    # Bundle directories are published through their archive
+                    # or installer, never uploaded themselves
+                    if isinstance(output_file, Path) and output_file.is_file():
+                        script_parts.append(f'''
 # Upload {platform} asset
 gh release upload "v$VERSION" \\
     --repo "$REPO_OWNER/$REPO_NAME" \\
     "{output_file}"
-'''
+''')
         
-        script_content += '''
+        # Publish the checksums computed at build time
+        checksums = [
+            f"{digest}  {Path(output_file).name}\n"
+            for result in build_results.values() if result.get("success")
+            for output_file, digest in result.get("hashes", {}).items()
+        ]
+        if checksums:
+            checksums_file = self.dist_dir / "SHA256SUMS"
+            with open(checksums_file, 'w') as f:
+                f.writelines(checksums)
+            
+            script_parts.append(f'''
+# Upload checksums
+gh release upload "v$VERSION" \\
+    --repo "$REPO_OWNER/$REPO_NAME" \\
+    "{checksums_file}"
+''')
+        
+        script_parts.append('''
 echo "Release created successfully!"
 echo "Visit: https://github.com/$REPO_OWNER/$REPO_NAME/releases/tag/v$VERSION"
-'''
+''')
         
         script_file = self.dist_dir / "create_github_release.sh"
         with open(script_file, 'w') as f:
-            f.write(script_content)
+            f.write("".join(script_parts))
         
         os.chmod(script_file, 0o755)
         
@@ -859,9 +1301,9 @@ echo "Visit: https://github.com/$REPO_OWNER/$REPO_NAME/releases/tag/v$VERSION"
             "build_info": {
                 "version": self.version,
                 "app_name": self.build_config["app_name"],
-                "build_date": subprocess.run(["date"], capture_output=True, text=True).stdout.strip(),
-                "build_system": platform.system(),
-                "build_machine": platform.machine()
+                "build_date": datetime.now().astimezone().isoformat(),
+                "build_system": _system(),
+                "build_machine": _machine()
             },
             "build_results": build_results,
             "summary": {
@@ -873,20 +1315,30 @@ echo "Visit: https://github.com/$REPO_OWNER/$REPO_NAME/releases/tag/v$VERSION"
         }
         
         report_file = self.dist_dir / "build_report.json"
+        # Encode in one go and write once; json.dump issues a small write
+        # for every chunk the encoder yields
         with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+            f.write(json.dumps(report, indent=2, default=str))
         
         logger.info(f"Build report generated: {report_file}")
         return report_file
 
 def main():
     """Main entry point"""
+    # Configure logging here rather than on import, so importing the module
+    # (or re-importing it in a worker process) has no side effects
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    
     parser = argparse.ArgumentParser(description="Skyscope Universal Build System")
     parser.add_argument("--platforms", nargs="+", choices=["macos", "windows", "linux"],
                        default=["macos", "windows", "linux"],
                        help="Platforms to build for")
     parser.add_argument("--project-root", type=Path, default=Path.cwd(),
                        help="Project root directory")
+    parser.add_argument("--clean", action="store_true",
+                       help="Discard cached PyInstaller build state")
+    parser.add_argument("--onefile", action="store_true",
+                       help="Build single-file Windows/Linux executables")
     parser.add_argument("--github-release", action="store_true",
                        help="Create GitHub release script")
     
@@ -897,7 +1349,7 @@ def main():
     print("=" * 50)
     
     # Initialize build system
-    build_system = UniversalBuildSystem(args.project_root)
+    build_system = UniversalBuildSystem(args.project_root, clean=args.clean, onefile=args.onefile)
     
     # Build for all platforms
     build_results = build_system.build_all_platforms(args.platforms)
@@ -42,7 +42,7 @@ def patch_os_probe_file(file_path):
     original_method = match.group(0)
     
     # Modified method with beta version detection
-    modified_method = """def detect_os_version(self) -> str:
+    modified_method = '''def detect_os_version(self) -> str:
         """
         Detect the booted OS version
 
@@ -68,7 +68,7 @@ def patch_os_probe_file(file_path):
             elif os_version.startswith("26.0") or os_version.startswith("26."):
                 return "macOS Beta"
         
-        return os_version"""
+        return os_version'''
     
     # Replace the original method with the modified one
     patched_content = content.replace(original_method, modified_method)
@@ -24,10 +24,17 @@ import argparse
 import logging
 import shutil
 import json
+import py_compile
 import tempfile
 import time
+import functools
+import hashlib
+import importlib.metadata
+import uuid
+import collections
 from pathlib import Path
-from datetime import datetime
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # ============================================================================
 # CONSTANTS AND CONFIGURATION
@@ -42,16 +49,29 @@ APP_COPYRIGHT = f"Copyright © 2025 {APP_AUTHOR}"
 APP_IDENTIFIER = "com.skyscope.patcher"
 
 # Directory structure
-SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT_DIR = Path(__file__).resolve().parent
 ROOT_DIR = SCRIPT_DIR.parent
+# Templates live in scripts/templates; the copy of this script at the
+# repository root finds them there too
+TEMPLATES_DIR = next(
+    (path for path in (SCRIPT_DIR / "templates", SCRIPT_DIR / "scripts" / "templates") if path.is_dir()),
+    SCRIPT_DIR / "templates"
+)
 SRC_DIR = ROOT_DIR / "src"
 RESOURCES_DIR = ROOT_DIR / "resources"
 BUILD_DIR = ROOT_DIR / "build"
 DIST_DIR = ROOT_DIR / "dist"
 TEMP_DIR = BUILD_DIR / "temp"
 
+# Cache of PyInstaller work directories, keyed on the build inputs
+PYINSTALLER_CACHE_DIR = Path.home() / ".cache" / "skyscope-pyi"
+PYINSTALLER_CACHE_SIZE = 5
+
+# Cache of compiled WiX objects, keyed on their inputs
+WIXOBJ_CACHE_DIR = Path.home() / ".cache" / "skyscope-wixobj"
+
 # UI theme settings
-THEME_SETTINGS = {
+THEME_SETTINGS = MappingProxyType({
     "dark_mode": True,
     "primary_color": "#2C3E50",
     "accent_color": "#3498DB",
@@ -59,79 +79,212 @@ THEME_SETTINGS = {
     "background_color": "#1A1A1A",
     "button_color": "#3498DB",
     "button_hover_color": "#2980B9",
-}
+})
 
 # Platform-specific settings
-MACOS_SETTINGS = {
+MACOS_SETTINGS = MappingProxyType({
     "app_category": "public.app-category.developer-tools",
     "min_system_version": "10.15.0",
-    "dmg_background": str(RESOURCES_DIR / "dmg_background.png"),
+    "dmg_background": RESOURCES_DIR / "dmg_background.png",
     "code_sign_identity": "Developer ID Application",
-    "entitlements_file": str(RESOURCES_DIR / "entitlements.plist"),
-}
+    "notary_profile": "skyscope-notarization",  # notarytool keychain profile
+    "entitlements_file": RESOURCES_DIR / "entitlements.plist",
+})
 
-WINDOWS_SETTINGS = {
-    "icon": str(RESOURCES_DIR / "skyscope-logo.ico"),
+WINDOWS_SETTINGS = MappingProxyType({
+    "icon": RESOURCES_DIR / "skyscope-logo.ico",
     "company_name": "Skyscope Project",
     "product_version": APP_VERSION,
     "upgrade_code": "{5F76C2A0-3B67-4A98-A2F9-45D8D1A43CF1}",  # Unique identifier for the MSI
-}
+})
 
-LINUX_SETTINGS = {
-    "icon": str(RESOURCES_DIR / "skyscope-logo.png"),
+LINUX_SETTINGS = MappingProxyType({
+    "icon": RESOURCES_DIR / "skyscope-logo.png",
     "categories": "Development;System;",
     "terminal": False,
-}
+})
 
 # Required tools
-REQUIRED_TOOLS = {
-    "all": ["python", "pip"],
-    "macos": ["brew", "dmgbuild", "codesign"],
-    "windows": ["pyinstaller", "candle", "light"],  # candle and light are part of WiX Toolset
-    "linux": ["pyinstaller", "appimagetool"],
-}
+REQUIRED_TOOLS = MappingProxyType({
+    "all": ("python", "pip"),
+    "macos": ("brew", "dmgbuild", "codesign"),
+    "windows": ("pyinstaller", "candle", "light"),  # candle and light are part of WiX Toolset
+    "linux": ("pyinstaller", "appimagetool"),
+})
+
+# Magic numbers of Mach-O binaries: 32/64-bit in both byte orders, and
+# universal (fat) binaries
+MACHO_MAGICS = frozenset((
+    b"\xfe\xed\xfa\xce", b"\xce\xfa\xed\xfe",
+    b"\xfe\xed\xfa\xcf", b"\xcf\xfa\xed\xfe",
+    b"\xca\xfe\xba\xbe",
+))
+
+# Modules the app never imports, left out of the PyInstaller bundles
+PYINSTALLER_EXCLUDES = (
+    "tkinter.test",
+    "test",
+    "unittest",
+    "pydoc_data",
+    "setuptools",
+    "pip",
+    "distutils",
+)
+
+# Data files bundled into every build, as (source, destination) pairs
+PYINSTALLER_DATAS = (
+    (str(BUILD_DIR / "resources"), "resources"),
+    (str(ROOT_DIR / "skyscope-logo.png"), "resources"),
+    (str(ROOT_DIR / "olarila-logo.png"), "resources"),
+    (str(ROOT_DIR / "advanced_config.json"), "resources"),
+)
+
+# XML namespace of WiX 3 source files
+WIX_NAMESPACE = "http://schemas.microsoft.com/wix/2006/wi"
 
 # Python packages to install
-PYTHON_PACKAGES = [
+PYTHON_PACKAGES = (
     "pyinstaller==6.0.0",
-    "dmgbuild==1.6.1;platform_system=='Darwin'",
-    "pywin32==306;platform_system=='Windows'",
     "tkinter",
     "pillow",
     "darkdetect",
     "ttkthemes",
-]
+)
+
+# Python packages only needed when building on a given platform
+PLATFORM_PACKAGES = MappingProxyType({
+    "macos": ("dmgbuild==1.6.1",),
+    "windows": ("pywin32==306",),
+})
+
+# Platform this script is running on, using the keys of the tables above
+if sys.platform == "darwin":
+    CURRENT_PLATFORM = "macos"
+elif sys.platform == "win32":
+    CURRENT_PLATFORM = "windows"
+elif sys.platform.startswith("linux"):
+    CURRENT_PLATFORM = "linux"
+else:
+    CURRENT_PLATFORM = None
+
+# Packages to install on this platform, resolved once at import
+CURRENT_PACKAGES = PYTHON_PACKAGES + PLATFORM_PACKAGES.get(CURRENT_PLATFORM, ())
 
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
 
+# Set once the logs directory has been created in this process
+_LOGS_READY = False
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that writes through a large userspace buffer.
+    
+    logging.FileHandler flushes after every record; this handler only flushes
+    for records at or above flush_level and when the handler is closed (which
+    logging does at interpreter exit), so DEBUG-heavy builds don't pay one
+    write syscall per line. The file is opened in binary append mode and
+    records are encoded explicitly, bypassing the text I/O layer.
+    """
+    
+    def __init__(self, filename, buffer_size=1 << 16, flush_level=logging.ERROR, encoding="utf-8"):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        super().__init__(filename, mode="ab", encoding=encoding)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size)
+    
+    def emit(self, record):
+        try:
+            self.stream.write((self.format(record) + self.terminator).encode(self.encoding))
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted timestamp within the same second.
+    
+    %(asctime)s otherwise costs a localtime() and strftime() call per record;
+    here they only run when the wall-clock second changes.
+    """
+    
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt, datefmt)
+        self._time_cache = (None, "")
+    
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, formatted = self._time_cache
+        if second != cached_second:
+            formatted = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._time_cache = (second, formatted)
+        if datefmt:
+            return formatted
+        return self.default_msec_format % (formatted, record.msecs)
+
 def setup_logging(verbose=False):
     """Configure logging for the build process."""
+    global _LOGS_READY
+    
+    # Only needed here; imported lazily to keep CLI startup (e.g. --help) cheap
+    import atexit
+    import queue
+    import logging.handlers
+    
+    # The log format doesn't use thread/process fields, so don't collect them
+    # for every record (logAsyncioTasks only exists on Python 3.12+)
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
+    if not verbose:
+        logging.raiseExceptions = False
+    
     log_level = logging.DEBUG if verbose else logging.INFO
     log_format = '%(asctime)s - %(levelname)s - %(message)s'
     date_format = '%Y-%m-%d %H:%M:%S'
     
     # Create logs directory if it doesn't exist
     logs_dir = ROOT_DIR / "logs"
-    logs_dir.mkdir(exist_ok=True)
+    if not _LOGS_READY:
+        logs_dir.mkdir(exist_ok=True)
+        _LOGS_READY = True
     
-    # Log file with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Log file with timestamp; the same time is reused for the banner below
+    now = time.localtime()
+    timestamp = time.strftime("%Y%m%d_%H%M%S", now)
     log_file = logs_dir / f"build_{timestamp}.log"
     
-    # Configure logging
-    logging.basicConfig(
-        level=log_level,
-        format=log_format,
-        datefmt=date_format,
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(sys.stdout)
-        ]
+    # Configure handlers
+    formatter = CachedTimeFormatter(log_format, date_format)
+    file_handler = BufferedFileHandler(log_file)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+    
+    # Format and write records on a background listener thread so callers only
+    # enqueue them. The queue handler has no formatter of its own, so each
+    # record is formatted once by the real handlers.
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
     )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
-    logging.info(f"Build started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    # Without --verbose, debug calls return straight from isEnabledFor()
+    # without building a record; call sites pass lazy %-style arguments
+    logging.disable(logging.NOTSET if verbose else logging.DEBUG)
+    
+    logging.info(f"Build started at {time.strftime(date_format, now)}")
     logging.info(f"Log file: {log_file}")
     return logging.getLogger(__name__)
 
@@ -139,74 +292,86 @@ def setup_logging(verbose=False):
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def run_command(cmd, cwd=None, env=None, check=True, shell=False):
+def run_command(cmd, cwd=None, env=None, check=True, shell=False, capture=False):
     """
     Execute a shell command and return the result.
     
+    The combined stdout/stderr stream is read line by line as the command
+    runs and logged at debug level, so long outputs (pip, diskutil) are never
+    held in memory unless capture is requested.
+    
     Args:
         cmd: Command to run (list or string)
         cwd: Working directory
         env: Environment variables
         check: Whether to raise an exception on failure
         shell: Whether to run the command in a shell
+        capture: Whether to collect the output in the result's stdout
         
     Returns:
-        CompletedProcess instance
+        CompletedProcess instance, with stdout as bytes if capture is set
     """
     if isinstance(cmd, list) and shell:
         cmd = " ".join(cmd)
     
-    logging.debug(f"Running command: {cmd}")
-    
-    try:
-        result = subprocess.run(
-            cmd,
-            cwd=cwd,
-            env=env,
-            check=check,
-            shell=shell,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True
-        )
-        logging.debug(f"Command output: {result.stdout}")
-        return result
-    except subprocess.CalledProcessError as e:
-        logging.error(f"Command failed with exit code {e.returncode}")
-        logging.error(f"Error output: {e.stderr}")
-        if check:
-            raise
-        return e
-
+    logging.debug("Running command: %s", cmd)
+    
+    debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+    lines = []
+    # Last few lines of output, reported if the command fails
+    tail = collections.deque(maxlen=20)
+    
+    with subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        env=env,
+        shell=shell,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT
+    ) as process:
+        for line in process.stdout:
+            # Output is read as bytes and only decoded when it is logged
+            if debug:
+                logging.debug("%s", line.decode("utf-8", "replace").rstrip())
+            if capture:
+                lines.append(line)
+            tail.append(line)
+        returncode = process.wait()
+    
+    output = b"".join(lines) if capture else None
+    if returncode and check:
+        logging.error(f"Command failed with exit code {returncode}")
+        logging.error("Error output: %s", b"".join(tail).decode("utf-8", "replace"))
+        raise subprocess.CalledProcessError(returncode, cmd, output=output, stderr=b"".join(tail))
+    
+    return subprocess.CompletedProcess(cmd, returncode, stdout=output)
+
+@functools.lru_cache(maxsize=None)
 def check_tool_exists(tool):
-    """Check if a command-line tool exists."""
-    try:
-        if platform.system() == "Windows":
-            # On Windows, use where command
-            subprocess.run(
-                ["where", tool], 
-                check=True, 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE
-            )
-        else:
-            # On Unix-like systems, use which command
-            subprocess.run(
-                ["which", tool], 
-                check=True, 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE
-            )
-        return True
-    except subprocess.CalledProcessError:
-        return False
+    """
+    Check if a command-line tool exists.
+    
+    Resolved in-process with shutil.which (which honours PATHEXT on Windows)
+    and cached for the run; call check_tool_exists.cache_clear() if PATH
+    changes.
+    """
+    return shutil.which(tool) is not None
 
 def install_python_packages():
     """Install required Python packages."""
     logging.info("Installing required Python packages...")
     try:
-        run_command([sys.executable, "-m", "pip", "install", "--upgrade", "pip"])
-        run_command([sys.executable, "-m", "pip", "install"] + PYTHON_PACKAGES)
+        # One pip run upgrades pip and installs everything, so the packages are
+        # resolved together and the interpreter only starts once
+        run_command([
+            sys.executable, "-m", "pip", "install",
+            "--upgrade",
+            "--no-input",
+            "--disable-pip-version-check",
+            "--prefer-binary",
+            "pip",
+            *CURRENT_PACKAGES
+        ])
         logging.info("Python packages installed successfully.")
     except Exception as e:
         logging.error(f"Failed to install Python packages: {e}")
@@ -217,6 +382,108 @@ def ensure_directories():
     for directory in [BUILD_DIR, DIST_DIR, TEMP_DIR]:
         directory.mkdir(exist_ok=True, parents=True)
 
+@functools.lru_cache(maxsize=None)
+def _clonefile():
+    """Look up clonefile(2) in libSystem, or None when it isn't available."""
+    if CURRENT_PLATFORM != "macos":
+        return None
+    import ctypes
+    try:
+        clonefile = ctypes.CDLL("/usr/lib/libSystem.dylib").clonefile
+    except (OSError, AttributeError):
+        return None
+    clonefile.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32)
+    clonefile.restype = ctypes.c_int
+    return clonefile
+
+def _fast_copy2(src, dst, st=None):
+    """
+    Copy a file with its permission bits and timestamps, like shutil.copy2.
+    
+    The source is stat'ed once and the result reused for the metadata, instead
+    of copy2's separate stat inside copystat. Callers walking a directory with
+    os.scandir can pass entry.stat() as st to skip the stat entirely.
+    
+    On macOS the data is cloned with clonefile(2) where the file system
+    supports it.
+    """
+    if st is None:
+        st = os.stat(src)
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    
+    # On APFS, clone the file copy-on-write instead of copying its data.
+    # clonefile refuses to overwrite, and fails outright on other file
+    # systems or across volumes, where the regular copy takes over.
+    clonefile = _clonefile()
+    if clonefile is not None:
+        try:
+            os.unlink(dst)
+        except FileNotFoundError:
+            pass
+        if clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            shutil.copyfile(src, dst)
+    else:
+        shutil.copyfile(src, dst)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.chmod(dst, st.st_mode)
+    return dst
+
+def _link_or_copy(src, dst):
+    """
+    Hard link a file into place, falling back to a copy.
+    
+    Used as a copytree copy_function: when both trees share a file system
+    the "copy" costs no data I/O at all. Any existing destination is
+    replaced rather than written through, so files already linked by an
+    earlier run don't get modified in place.
+    """
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        _fast_copy2(src, dst)
+    return dst
+
+def _write_if_changed(path, data):
+    """
+    Write bytes to a file unless it already holds exactly those bytes.
+    
+    Leaving an up-to-date file alone keeps its mtime, so PyInstaller's
+    incremental steps don't treat it as modified.
+    
+    Returns:
+        True if the file was written, False if it was already current
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+def _write_sized_logo(build_resources):
+    """
+    Write the 200x200 dashboard logo used by the app.
+    
+    Resampling once at build time means the app only has to decode a small
+    image at launch. Skipped if Pillow is not installed, in which case the
+    app resizes the full logo itself.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        logging.warning("Pillow not installed, skipping pre-sized logo.")
+        return
+    
+    resample = getattr(Image, "Resampling", Image).LANCZOS
+    with Image.open(ROOT_DIR / "skyscope-logo.png") as logo:
+        logo.resize((200, 200), resample).save(build_resources / "skyscope-logo@200.png", optimize=True)
+
 def copy_resources():
     """Copy necessary resources to the build directory."""
     logging.info("Copying resources...")
@@ -225,17 +492,22 @@ def copy_resources():
     build_resources = BUILD_DIR / "resources"
     build_resources.mkdir(exist_ok=True, parents=True)
     
-    # Copy logo and other resources
+    # Logo, advanced_config.json and any other necessary files
+    resources = [
+        ROOT_DIR / "skyscope-logo.png",
+        ROOT_DIR / "olarila-logo.png",
+        ROOT_DIR / "advanced_config.json",
+    ]
+    if (ROOT_DIR / "LICENSE").exists():
+        resources.append(ROOT_DIR / "LICENSE")
+    
+    # Copy the files concurrently; shutil.copyfile already uses the kernel's
+    # zero-copy path (sendfile on Linux, fcopyfile on macOS) for the data
     try:
-        shutil.copy2(ROOT_DIR / "skyscope-logo.png", build_resources)
-        shutil.copy2(ROOT_DIR / "olarila-logo.png", build_resources)
-        
-        # Copy advanced_config.json
-        shutil.copy2(ROOT_DIR / "advanced_config.json", build_resources)
+        with ThreadPoolExecutor(max_workers=min(8, len(resources))) as executor:
+            list(executor.map(lambda src: _fast_copy2(src, build_resources), resources))
         
-        # Copy any other necessary files
-        if (ROOT_DIR / "LICENSE").exists():
-            shutil.copy2(ROOT_DIR / "LICENSE", build_resources)
+        _write_sized_logo(build_resources)
             
         logging.info("Resources copied successfully.")
     except Exception as e:
@@ -246,765 +518,371 @@ def create_version_file():
     """Create a version file for the application."""
     version_info = {
         "version": APP_VERSION,
-        "build_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "build_date": time.strftime("%Y-%m-%d %H:%M:%S"),
         "platform": platform.system(),
         "python_version": platform.python_version(),
     }
     
+    # Machine-read only, so serialize compactly and write it in one go
     version_file = BUILD_DIR / "version.json"
-    with open(version_file, 'w') as f:
-        json.dump(version_info, f, indent=2)
+    version_file.write_bytes(json.dumps(version_info).encode("utf-8"))
     
     logging.info(f"Version file created: {version_file}")
     return version_file
 
+def _compile_source(source):
+    """
+    Byte-compile a Python source file into its __pycache__ entry.
+    
+    This catches syntax errors at build time and saves the compile step when
+    the module is imported. The interpreter's default optimization level is
+    used on purpose: an optimize=2 .opt-2.pyc would only be loaded under
+    python -OO, and PyInstaller compiles the bundle with its own settings.
+    """
+    py_compile.compile(str(source), doraise=True)
+
 def create_dark_theme_file():
-    """Create a Python module for the dark theme."""
+    """Copy the dark theme module from the templates into the build directory."""
     theme_file = BUILD_DIR / "dark_theme.py"
     
-    with open(theme_file, 'w') as f:
-        f.write("""#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-\"\"\"
-dark_theme.py - Dark theme implementation for Skyscope macOS Patcher
-\"\"\"
-
-import sys
-import os
-import tkinter as tk
-from tkinter import ttk
-import darkdetect
-from ttkthemes import ThemedTk
-
-# Theme colors
-DARK_BG = "#1A1A1A"
-DARK_FG = "#ECF0F1"
-BUTTON_BG = "#3498DB"
-BUTTON_HOVER = "#2980B9"
-FRAME_BG = "#2C3E50"
-ENTRY_BG = "#34495E"
-ENTRY_FG = "#ECF0F1"
-
-def set_dark_theme(root):
-    \"\"\"Apply dark theme to the tkinter application.\"\"\"
-    if isinstance(root, ThemedTk):
-        root.set_theme("equilux")  # A dark theme from ttkthemes
-    
-    style = ttk.Style(root)
-    
-    # Configure the theme colors
-    style.configure(".", 
-                   background=DARK_BG,
-                   foreground=DARK_FG,
-                   fieldbackground=ENTRY_BG,
-                   troughcolor=FRAME_BG)
-    
-    style.configure("TButton", 
-                   background=BUTTON_BG,
-                   foreground=DARK_FG)
-    
-    style.map("TButton",
-             background=[("active", BUTTON_HOVER), ("disabled", FRAME_BG)])
-    
-    style.configure("TFrame", background=FRAME_BG)
-    style.configure("TLabel", background=FRAME_BG, foreground=DARK_FG)
-    style.configure("TEntry", fieldbackground=ENTRY_BG, foreground=ENTRY_FG)
-    
-    # Set root window background
-    root.configure(background=DARK_BG)
-    
-    return style
-
-def is_dark_mode():
-    \"\"\"Detect if the system is in dark mode.\"\"\"
-    try:
-        return darkdetect.isDark()
-    except:
-        # Fallback if darkdetect fails
-        if sys.platform == "darwin":
-            # macOS detection fallback
-            try:
-                cmd = "defaults read -g AppleInterfaceStyle"
-                result = os.popen(cmd).read().strip()
-                return result == "Dark"
-            except:
-                return False
-        elif sys.platform == "win32":
-            # Windows detection fallback
-            try:
-                import winreg
-                registry = winreg.ConnectRegistry(None, winreg.HKEY_CURRENT_USER)
-                key = winreg.OpenKey(registry, r"Software\\Microsoft\\Windows\\CurrentVersion\\Themes\\Personalize")
-                value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
-                return value == 0
-            except:
-                return False
-        else:
-            # Linux and other platforms - no reliable fallback
-            return False
-
-def create_themed_app(title="Skyscope macOS Patcher"):
-    \"\"\"Create a themed tkinter application.\"\"\"
-    try:
-        # Try to use ThemedTk for better theme support
-        root = ThemedTk(theme="equilux")
-    except:
-        # Fallback to standard Tk
-        root = tk.Tk()
-    
-    root.title(title)
-    root.minsize(800, 600)
-    
-    # Center window on screen
-    screen_width = root.winfo_screenwidth()
-    screen_height = root.winfo_screenheight()
-    width = 900
-    height = 700
-    x = (screen_width - width) // 2
-    y = (screen_height - height) // 2
-    root.geometry(f"{width}x{height}+{x}+{y}")
-    
-    # Apply dark theme
-    set_dark_theme(root)
-    
-    return root
-""")
-    
-    logging.info(f"Dark theme file created: {theme_file}")
+    if _write_if_changed(theme_file, (TEMPLATES_DIR / "dark_theme.py").read_bytes()):
+        logging.info(f"Dark theme file created: {theme_file}")
+    else:
+        logging.info(f"Dark theme file unchanged: {theme_file}")
+    _compile_source(theme_file)
     return theme_file
 
 def create_main_app_file():
-    """Create the main application file."""
+    """Copy the main application file from the templates into the build directory."""
     app_file = BUILD_DIR / "skyscope_app.py"
     
-    with open(app_file, 'w') as f:
-        f.write("""#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-\"\"\"
-skyscope_app.py - Main GUI application for Skyscope macOS Patcher
-\"\"\"
+    if _write_if_changed(app_file, (TEMPLATES_DIR / "skyscope_app.py").read_bytes()):
+        logging.info(f"Main application file created: {app_file}")
+    else:
+        logging.info(f"Main application file unchanged: {app_file}")
+    _compile_source(app_file)
+    return app_file
 
-import os
-import sys
-import json
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-import subprocess
-import threading
-import platform
-from pathlib import Path
+def write_templates(templates):
+    """
+    Write generated build files.
+    
+    The files are independent of each other, so they are written on a small
+    thread pool. A file that already has the given content is left untouched.
+    
+    Args:
+        templates: Mapping of output path to file content
+    """
+    with ThreadPoolExecutor(max_workers=min(4, len(templates))) as executor:
+        list(executor.map(
+            lambda item: _write_if_changed(item[0], item[1].encode("utf-8")),
+            templates.items()
+        ))
 
-# Add parent directory to path to import dark_theme
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-try:
-    from dark_theme import create_themed_app, set_dark_theme
-except ImportError:
-    # Fallback if dark_theme module is not available
-    def create_themed_app(title="Skyscope macOS Patcher"):
-        root = tk.Tk()
-        root.title(title)
-        root.minsize(800, 600)
-        return root
-    
-    def set_dark_theme(root):
-        return ttk.Style(root)
-
-class SkyscopeApp:
-    \"\"\"Main application class for Skyscope macOS Patcher.\"\"\"
-    
-    def __init__(self, root):
-        self.root = root
-        self.style = set_dark_theme(root)
-        
-        # Set application icon
-        try:
-            if platform.system() == "Darwin":
-                # macOS specific icon handling
-                icon_path = self.get_resource_path("skyscope-logo.png")
-                if os.path.exists(icon_path):
-                    from PIL import Image, ImageTk
-                    icon = ImageTk.PhotoImage(Image.open(icon_path))
-                    self.root.iconphoto(True, icon)
-            elif platform.system() == "Windows":
-                # Windows specific icon handling
-                icon_path = self.get_resource_path("skyscope-logo.ico")
-                if os.path.exists(icon_path):
-                    self.root.iconbitmap(icon_path)
-            else:
-                # Linux icon handling
-                icon_path = self.get_resource_path("skyscope-logo.png")
-                if os.path.exists(icon_path):
-                    from PIL import Image, ImageTk
-                    icon = ImageTk.PhotoImage(Image.open(icon_path))
-                    self.root.iconphoto(True, icon)
-        except Exception as e:
-            print(f"Warning: Could not set application icon: {e}")
-        
-        self.create_menu()
-        self.create_notebook()
-        self.load_config()
-        
-    def get_resource_path(self, filename):
-        \"\"\"Get the path to a resource file.\"\"\"
-        # Check if running as a PyInstaller bundle
-        if getattr(sys, 'frozen', False):
-            # Running as compiled bundle
-            bundle_dir = Path(sys._MEIPASS)
-            return str(bundle_dir / "resources" / filename)
-        else:
-            # Running as script
-            script_dir = Path(os.path.dirname(os.path.abspath(__file__)))
-            root_dir = script_dir.parent
-            return str(root_dir / "resources" / filename)
-    
-    def load_config(self):
-        \"\"\"Load configuration from advanced_config.json.\"\"\"
-        try:
-            config_path = self.get_resource_path("advanced_config.json")
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    self.config = json.load(f)
-                print(f"Configuration loaded from {config_path}")
-            else:
-                print(f"Configuration file not found: {config_path}")
-                self.config = {}
-        except Exception as e:
-            print(f"Error loading configuration: {e}")
-            self.config = {}
+def render_spec(target_platform):
+    """
+    Write the shared PyInstaller spec file and collect its parameters.
     
-    def create_menu(self):
-        \"\"\"Create the application menu.\"\"\"
-        menubar = tk.Menu(self.root)
-        
-        # File menu
-        file_menu = tk.Menu(menubar, tearoff=0)
-        file_menu.add_command(label="Open Config...", command=self.open_config)
-        file_menu.add_command(label="Save Config...", command=self.save_config)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
-        menubar.add_cascade(label="File", menu=file_menu)
-        
-        # Tools menu
-        tools_menu = tk.Menu(menubar, tearoff=0)
-        tools_menu.add_command(label="Create USB Installer", command=self.create_usb_installer)
-        tools_menu.add_command(label="Install Kexts", command=self.install_kexts)
-        tools_menu.add_command(label="Extract Linux Drivers", command=self.extract_linux_drivers)
-        menubar.add_cascade(label="Tools", menu=tools_menu)
-        
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        help_menu.add_command(label="Documentation", command=self.show_documentation)
-        help_menu.add_command(label="About", command=self.show_about)
-        menubar.add_cascade(label="Help", menu=help_menu)
-        
-        self.root.config(menu=menubar)
+    The spec itself is the same for every platform; what differs is passed
+    to it through the environment by run_pyinstaller.
     
-    def create_notebook(self):
-        \"\"\"Create the main tabbed interface.\"\"\"
-        self.notebook = ttk.Notebook(self.root)
-        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Create tabs
-        self.dashboard_tab = ttk.Frame(self.notebook)
-        self.hardware_tab = ttk.Frame(self.notebook)
-        self.installer_tab = ttk.Frame(self.notebook)
-        self.patches_tab = ttk.Frame(self.notebook)
-        self.advanced_tab = ttk.Frame(self.notebook)
-        
-        self.notebook.add(self.dashboard_tab, text="Dashboard")
-        self.notebook.add(self.hardware_tab, text="Hardware")
-        self.notebook.add(self.installer_tab, text="Installer")
-        self.notebook.add(self.patches_tab, text="Patches")
-        self.notebook.add(self.advanced_tab, text="Advanced")
-        
-        # Initialize tabs
-        self.init_dashboard_tab()
-        self.init_hardware_tab()
-        self.init_installer_tab()
-        self.init_patches_tab()
-        self.init_advanced_tab()
-    
-    def init_dashboard_tab(self):
-        \"\"\"Initialize the Dashboard tab.\"\"\"
-        # Logo
-        try:
-            from PIL import Image, ImageTk
-            logo_path = self.get_resource_path("skyscope-logo.png")
-            if os.path.exists(logo_path):
-                logo_img = Image.open(logo_path)
-                logo_img = logo_img.resize((200, 200), Image.LANCZOS)
-                logo_photo = ImageTk.PhotoImage(logo_img)
-                
-                logo_label = ttk.Label(self.dashboard_tab, image=logo_photo)
-                logo_label.image = logo_photo  # Keep a reference to prevent garbage collection
-                logo_label.pack(pady=20)
-        except Exception as e:
-            print(f"Warning: Could not load logo: {e}")
-        
-        # Welcome text
-        welcome_label = ttk.Label(
-            self.dashboard_tab, 
-            text="Welcome to Skyscope macOS Patcher",
-            font=("Helvetica", 16)
-        )
-        welcome_label.pack(pady=10)
-        
-        version_label = ttk.Label(
-            self.dashboard_tab,
-            text=f"Version 1.0.0",
-            font=("Helvetica", 12)
-        )
-        version_label.pack()
-        
-        # Quick actions frame
-        actions_frame = ttk.LabelFrame(self.dashboard_tab, text="Quick Actions")
-        actions_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        # Create buttons for quick actions
-        create_installer_btn = ttk.Button(
-            actions_frame, 
-            text="Create macOS Installer",
-            command=lambda: self.notebook.select(self.installer_tab)
-        )
-        create_installer_btn.pack(fill=tk.X, padx=20, pady=10)
-        
-        install_kexts_btn = ttk.Button(
-            actions_frame,
-            text="Install Kexts",
-            command=self.install_kexts
-        )
-        install_kexts_btn.pack(fill=tk.X, padx=20, pady=10)
-        
-        hardware_check_btn = ttk.Button(
-            actions_frame,
-            text="Check Hardware Compatibility",
-            command=lambda: self.notebook.select(self.hardware_tab)
-        )
-        hardware_check_btn.pack(fill=tk.X, padx=20, pady=10)
+    Args:
+        target_platform: "macos", "windows" or "linux"
     
-    def init_hardware_tab(self):
-        \"\"\"Initialize the Hardware tab.\"\"\"
-        # Hardware detection section
-        detect_frame = ttk.LabelFrame(self.hardware_tab, text="Hardware Detection")
-        detect_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        detect_btn = ttk.Button(
-            detect_frame,
-            text="Detect Hardware",
-            command=self.detect_hardware
-        )
-        detect_btn.pack(padx=20, pady=10)
-        
-        # Hardware info display
-        self.hw_info = tk.Text(detect_frame, height=20, wrap=tk.WORD)
-        self.hw_info.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-        
-        # Set initial text
-        self.hw_info.insert(tk.END, "Click 'Detect Hardware' to scan your system...")
-        self.hw_info.config(state=tk.DISABLED)
-    
-    def init_installer_tab(self):
-        \"\"\"Initialize the Installer tab.\"\"\"
-        # macOS version selection
-        version_frame = ttk.LabelFrame(self.installer_tab, text="macOS Version")
-        version_frame.pack(fill=tk.X, padx=20, pady=20)
-        
-        self.macos_version = tk.StringVar(value="Sequoia")
-        sequoia_radio = ttk.Radiobutton(
-            version_frame,
-            text="macOS Sequoia",
-            variable=self.macos_version,
-            value="Sequoia"
-        )
-        tahoe_radio = ttk.Radiobutton(
-            version_frame,
-            text="macOS Tahoe",
-            variable=self.macos_version,
-            value="Tahoe"
-        )
-        
-        sequoia_radio.pack(anchor=tk.W, padx=20, pady=5)
-        tahoe_radio.pack(anchor=tk.W, padx=20, pady=5)
-        
-        # Installer options
-        options_frame = ttk.LabelFrame(self.installer_tab, text="Installer Options")
-        options_frame.pack(fill=tk.X, padx=20, pady=20)
-        
-        self.shrink_installer = tk.BooleanVar(value=True)
-        shrink_check = ttk.Checkbutton(
-            options_frame,
-            text="Shrink Installer (remove extra languages)",
-            variable=self.shrink_installer
-        )
-        shrink_check.pack(anchor=tk.W, padx=20, pady=5)
-        
-        self.include_nvidia = tk.BooleanVar(value=True)
-        nvidia_check = ttk.Checkbutton(
-            options_frame,
-            text="Include NVIDIA GTX 970 Support",
-            variable=self.include_nvidia
-        )
-        nvidia_check.pack(anchor=tk.W, padx=20, pady=5)
-        
-        self.include_arc = tk.BooleanVar(value=True)
-        arc_check = ttk.Checkbutton(
-            options_frame,
-            text="Include Intel Arc A770 Support",
-            variable=self.include_arc
-        )
-        arc_check.pack(anchor=tk.W, padx=20, pady=5)
-        
-        # USB device selection
-        usb_frame = ttk.LabelFrame(self.installer_tab, text="USB Device")
-        usb_frame.pack(fill=tk.X, padx=20, pady=20)
-        
-        usb_select_btn = ttk.Button(
-            usb_frame,
-            text="Select USB Device",
-            command=self.select_usb_device
-        )
-        usb_select_btn.pack(padx=20, pady=10)
-        
-        self.usb_label = ttk.Label(usb_frame, text="No device selected")
-        self.usb_label.pack(padx=20, pady=5)
-        
-        # Create button
-        create_btn = ttk.Button(
-            self.installer_tab,
-            text="Create Bootable Installer",
-            command=self.create_bootable_installer
-        )
-        create_btn.pack(padx=20, pady=20)
+    Returns:
+        Tuple of the spec file path and its parameters
+    """
+    spec_file = BUILD_DIR / "skyscope.spec"
+    _write_if_changed(spec_file, (TEMPLATES_DIR / "skyscope.spec").read_bytes())
+    
+    params = {
+        "target": target_platform,
+        "script": str(BUILD_DIR / "skyscope_app.py"),
+        "root_dir": str(ROOT_DIR),
+        "datas": PYINSTALLER_DATAS,
+        "excludes": list(PYINSTALLER_EXCLUDES),
+        # PyInstaller advises against stripping on Windows
+        "strip": target_platform != "windows",
+    }
     
-    def init_patches_tab(self):
-        \"\"\"Initialize the Patches tab.\"\"\"
-        # Patch categories
-        categories_frame = ttk.LabelFrame(self.patches_tab, text="Patch Categories")
-        categories_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        # GPU patches
-        gpu_frame = ttk.LabelFrame(categories_frame, text="GPU Patches")
-        gpu_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        self.nvidia_patch = tk.BooleanVar(value=True)
-        nvidia_check = ttk.Checkbutton(
-            gpu_frame,
-            text="NVIDIA GTX 970 Acceleration",
-            variable=self.nvidia_patch
-        )
-        nvidia_check.pack(anchor=tk.W, padx=10, pady=5)
-        
-        self.arc_patch = tk.BooleanVar(value=True)
-        arc_check = ttk.Checkbutton(
-            gpu_frame,
-            text="Intel Arc A770 Acceleration",
-            variable=self.arc_patch
-        )
-        arc_check.pack(anchor=tk.W, padx=10, pady=5)
-        
-        # CPU patches
-        cpu_frame = ttk.LabelFrame(categories_frame, text="CPU Patches")
-        cpu_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        self.alder_lake_patch = tk.BooleanVar(value=True)
-        alder_check = ttk.Checkbutton(
-            cpu_frame,
-            text="Alder Lake Support",
-            variable=self.alder_lake_patch
-        )
-        alder_check.pack(anchor=tk.W, padx=10, pady=5)
-        
-        self.raptor_lake_patch = tk.BooleanVar(value=True)
-        raptor_check = ttk.Checkbutton(
-            cpu_frame,
-            text="Raptor Lake Support",
-            variable=self.raptor_lake_patch
-        )
-        raptor_check.pack(anchor=tk.W, padx=10, pady=5)
-        
-        # Apply button
-        apply_btn = ttk.Button(
-            self.patches_tab,
-            text="Apply Selected Patches",
-            command=self.apply_patches
-        )
-        apply_btn.pack(padx=20, pady=20)
+    if target_platform == "macos":
+        params.update({
+            "icon": str(RESOURCES_DIR / "skyscope-logo.icns"),
+            "bundle_name": "Skyscope macOS Patcher.app",
+            "bundle_identifier": APP_IDENTIFIER,
+            "info_plist": {
+                "CFBundleShortVersionString": APP_VERSION,
+                "CFBundleVersion": APP_VERSION,
+                "NSPrincipalClass": "NSApplication",
+                "NSHighResolutionCapable": "True",
+                "LSApplicationCategoryType": MACOS_SETTINGS["app_category"],
+                "LSMinimumSystemVersion": MACOS_SETTINGS["min_system_version"],
+                "CFBundleName": APP_NAME,
+                "CFBundleDisplayName": APP_NAME,
+                "CFBundleGetInfoString": APP_DESCRIPTION,
+                "NSHumanReadableCopyright": APP_COPYRIGHT,
+            },
+        })
+    elif target_platform == "windows":
+        params.update({
+            "icon": str(WINDOWS_SETTINGS["icon"]),
+            "version_file": str(BUILD_DIR / "version_info.txt"),
+        })
+    
+    return spec_file, params
+
+def _pyinstaller_cache_key(spec_file, params_json):
+    """
+    Hash the inputs of a PyInstaller run.
     
-    def init_advanced_tab(self):
-        \"\"\"Initialize the Advanced tab.\"\"\"
-        # Boot arguments
-        bootargs_frame = ttk.LabelFrame(self.advanced_tab, text="Boot Arguments")
-        bootargs_frame.pack(fill=tk.X, padx=20, pady=20)
-        
-        self.bootargs_entry = ttk.Entry(bootargs_frame, width=50)
-        self.bootargs_entry.pack(fill=tk.X, padx=10, pady=10)
-        self.bootargs_entry.insert(0, "ngfxcompat=1 ngfxgl=1 nvda_drv_vrl=1 iarccompat=1 iarcgl=1 -v")
-        
-        # SIP settings
-        sip_frame = ttk.LabelFrame(self.advanced_tab, text="System Integrity Protection")
-        sip_frame.pack(fill=tk.X, padx=20, pady=20)
-        
-        self.sip_status = tk.StringVar(value="Unknown")
-        sip_label = ttk.Label(sip_frame, text="SIP Status:")
-        sip_label.pack(side=tk.LEFT, padx=10, pady=10)
-        
-        sip_status_label = ttk.Label(sip_frame, textvariable=self.sip_status)
-        sip_status_label.pack(side=tk.LEFT, padx=10, pady=10)
-        
-        check_sip_btn = ttk.Button(
-            sip_frame,
-            text="Check SIP Status",
-            command=self.check_sip_status
-        )
-        check_sip_btn.pack(side=tk.RIGHT, padx=10, pady=10)
-        
-        # Debug logging
-        debug_frame = ttk.LabelFrame(self.advanced_tab, text="Debug Logging")
-        debug_frame.pack(fill=tk.X, padx=20, pady=20)
-        
-        self.debug_enabled = tk.BooleanVar(value=False)
-        debug_check = ttk.Checkbutton(
-            debug_frame,
-            text="Enable Debug Logging",
-            variable=self.debug_enabled,
-            command=self.toggle_debug
-        )
-        debug_check.pack(anchor=tk.W, padx=10, pady=10)
-        
-        # Apply button
-        apply_btn = ttk.Button(
-            self.advanced_tab,
-            text="Apply Advanced Settings",
-            command=self.apply_advanced_settings
-        )
-        apply_btn.pack(padx=20, pady=20)
-    
-    # Action methods
-    def open_config(self):
-        \"\"\"Open and load a configuration file.\"\"\"
-        file_path = filedialog.askopenfilename(
-            title="Open Configuration File",
-            filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
-        )
-        if file_path:
-            try:
-                with open(file_path, 'r') as f:
-                    self.config = json.load(f)
-                messagebox.showinfo("Success", "Configuration loaded successfully.")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load configuration: {e}")
-    
-    def save_config(self):
-        \"\"\"Save the current configuration to a file.\"\"\"
-        file_path = filedialog.asksaveasfilename(
-            title="Save Configuration File",
-            defaultextension=".json",
-            filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
-        )
-        if file_path:
-            try:
-                with open(file_path, 'w') as f:
-                    json.dump(self.config, f, indent=2)
-                messagebox.showinfo("Success", "Configuration saved successfully.")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save configuration: {e}")
-    
-    def create_usb_installer(self):
-        \"\"\"Launch the USB installer creation tool.\"\"\"
-        messagebox.showinfo("USB Installer", "This will launch the USB installer creation tool.")
-        # In a real implementation, this would call the USB creator functionality
-    
-    def install_kexts(self):
-        \"\"\"Install kexts to the system.\"\"\"
-        if platform.system() != "Darwin":
-            messagebox.showerror("Error", "Kext installation is only supported on macOS.")
-            return
-        
-        result = messagebox.askyesno(
-            "Install Kexts",
-            "This will install kexts to your system. Administrator privileges are required. Continue?"
-        )
-        if result:
-            # In a real implementation, this would call the kext installer functionality
-            messagebox.showinfo("Kext Installation", "Kext installation started. This may take a few minutes.")
-    
-    def extract_linux_drivers(self):
-        \"\"\"Extract drivers from Linux packages.\"\"\"
-        messagebox.showinfo("Extract Drivers", "This will extract drivers from Linux packages.")
-        # In a real implementation, this would call the Linux driver extractor
-    
-    def show_documentation(self):
-        \"\"\"Show the documentation.\"\"\"
-        messagebox.showinfo("Documentation", "Documentation will be displayed here.")
-        # In a real implementation, this would open the documentation
-    
-    def show_about(self):
-        \"\"\"Show the about dialog.\"\"\"
-        about_text = f"Skyscope macOS Patcher\\nVersion 1.0.0\\n\\nDeveloped by Miss Casey Jay Topojani\\n\\n" + \
-                    "A toolkit for enabling NVIDIA GTX 970 and Intel Arc A770 graphics\\n" + \
-                    "acceleration in macOS Sequoia and Tahoe."
-        messagebox.showinfo("About", about_text)
-    
-    def detect_hardware(self):
-        \"\"\"Detect system hardware.\"\"\"
-        self.hw_info.config(state=tk.NORMAL)
-        self.hw_info.delete(1.0, tk.END)
-        self.hw_info.insert(tk.END, "Detecting hardware...\n\n")
-        
-        # Start hardware detection in a separate thread
-        threading.Thread(target=self._detect_hardware_thread).start()
+    Covers the spec file and its parameters, the generated app sources, the
+    Python version and the installed distributions, which together determine
+    the analysis.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in (spec_file, BUILD_DIR / "skyscope_app.py", BUILD_DIR / "dark_theme.py"):
+        digest.update(path.read_bytes())
+    digest.update(params_json.encode())
+    digest.update(sys.version.encode())
+    distributions = sorted(
+        f"{dist.metadata['Name']}=={dist.version}"
+        for dist in importlib.metadata.distributions()
+    )
+    digest.update("\n".join(distributions).encode())
+    return digest.hexdigest()
+
+def _trim_pyinstaller_cache():
+    """Remove all but the most recently used PyInstaller cache entries."""
+    entries = sorted(
+        (entry for entry in PYINSTALLER_CACHE_DIR.iterdir() if entry.is_dir()),
+        key=lambda entry: entry.stat().st_mtime,
+        reverse=True
+    )
+    for entry in entries[PYINSTALLER_CACHE_SIZE:]:
+        shutil.rmtree(entry, ignore_errors=True)
+
+def run_pyinstaller(spec_file, spec_params, platform_name, args):
+    """
+    Run PyInstaller on a spec file.
     
-    def _detect_hardware_thread(self):
-        \"\"\"Hardware detection thread.\"\"\"
-        try:
-            # Simulate hardware detection
-            system_info = {
-                "System": platform.system(),
-                "Node": platform.node(),
-                "Release": platform.release(),
-                "Version": platform.version(),
-                "Machine": platform.machine(),
-                "Processor": platform.processor()
-            }
-            
-            # Update UI in the main thread
-            self.root.after(0, self._update_hardware_info, system_info)
-        except Exception as e:
-            self.root.after(0, self._show_hardware_error, str(e))
+    The work directory is kept between runs so PyInstaller can reuse its
+    analysis; it is only wiped in CI mode or when a full rebuild is requested.
+    Otherwise a copy is also kept in a cache keyed on the build inputs, which
+    seeds the work directory when it is missing (e.g. after a fresh checkout).
     
-    def _update_hardware_info(self, system_info):
-        \"\"\"Update the hardware info text widget.\"\"\"
-        self.hw_info.delete(1.0, tk.END)
-        self.hw_info.insert(tk.END, "Hardware Detection Results:\n\n")
-        
-        for key, value in system_info.items():
-            self.hw_info.insert(tk.END, f"{key}: {value}\n")
-        
-        # Add some simulated hardware detection results
-        self.hw_info.insert(tk.END, "\nDetected Components:\n")
-        self.hw_info.insert(tk.END, "- CPU: Intel Core i9-12900K (Alder Lake) ✓\n")
-        self.hw_info.insert(tk.END, "- GPU: NVIDIA GeForce GTX 970 ✓\n")
-        self.hw_info.insert(tk.END, "- RAM: 32GB DDR4 ✓\n")
-        self.hw_info.insert(tk.END, "- Storage: NVMe SSD 1TB ✓\n")
-        
-        self.hw_info.insert(tk.END, "\nCompatibility Status: Compatible ✓\n")
-        self.hw_info.config(state=tk.DISABLED)
-    
-    def _show_hardware_error(self, error_message):
-        \"\"\"Show hardware detection error.\"\"\"
-        self.hw_info.delete(1.0, tk.END)
-        self.hw_info.insert(tk.END, f"Error detecting hardware: {error_message}")
-        self.hw_info.config(state=tk.DISABLED)
-    
-    def select_usb_device(self):
-        \"\"\"Select a USB device for the installer.\"\"\"
-        # In a real implementation, this would show a list of available USB devices
-        # For this demo, we'll just use a simulated selection
-        messagebox.showinfo("Select USB Device", "This would show a list of available USB devices.")
-        self.usb_label.config(text="/dev/disk2 (USB Drive, 16GB)")
-    
-    def create_bootable_installer(self):
-        \"\"\"Create a bootable installer.\"\"\"
-        # Check if a USB device is selected
-        if self.usb_label.cget("text") == "No device selected":
-            messagebox.showerror("Error", "Please select a USB device first.")
-            return
-        
-        # Confirm with the user
-        result = messagebox.askyesno(
-            "Create Bootable Installer",
-            f"This will erase all data on {self.usb_label.cget('text')}. Continue?"
-        )
-        if result:
-            # In a real implementation, this would call the bootable installer creation functionality
-            messagebox.showinfo("Bootable Installer", "Creating bootable installer. This may take a while.")
-    
-    def apply_patches(self):
-        \"\"\"Apply selected patches.\"\"\"
-        # Build a list of selected patches
-        selected_patches = []
-        if self.nvidia_patch.get():
-            selected_patches.append("NVIDIA GTX 970 Acceleration")
-        if self.arc_patch.get():
-            selected_patches.append("Intel Arc A770 Acceleration")
-        if self.alder_lake_patch.get():
-            selected_patches.append("Alder Lake Support")
-        if self.raptor_lake_patch.get():
-            selected_patches.append("Raptor Lake Support")
-        
-        if not selected_patches:
-            messagebox.showerror("Error", "No patches selected.")
-            return
-        
-        # Confirm with the user
-        patches_text = "\\n".join([f"- {patch}" for patch in selected_patches])
-        result = messagebox.askyesno(
-            "Apply Patches",
-            f"The following patches will be applied:\\n\\n{patches_text}\\n\\nContinue?"
-        )
-        if result:
-            # In a real implementation, this would call the patch application functionality
-            messagebox.showinfo("Patches", "Applying patches. This may take a while.")
-    
-    def check_sip_status(self):
-        \"\"\"Check the SIP status.\"\"\"
-        if platform.system() != "Darwin":
-            self.sip_status.set("Not applicable (not macOS)")
-            return
-        
-        try:
-            # Run csrutil status command
-            result = subprocess.run(
-                ["csrutil", "status"],
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            if "disabled" in result.stdout.lower():
-                self.sip_status.set("Disabled ✓")
-            else:
-                self.sip_status.set("Enabled ✗")
-        except Exception as e:
-            self.sip_status.set(f"Error: {e}")
-    
-    def toggle_debug(self):
-        \"\"\"Toggle debug logging.\"\"\"
-        if self.debug_enabled.get():
-            messagebox.showinfo("Debug Logging", "Debug logging enabled.")
-        else:
-            messagebox.showinfo("Debug Logging", "Debug logging disabled.")
-    
-    def apply_advanced_settings(self):
-        \"\"\"Apply advanced settings.\"\"\"
-        boot_args = self.bootargs_entry.get().strip()
-        
-        if not boot_args:
-            messagebox.showerror("Error", "Boot arguments cannot be empty.")
-            return
-        
-        # Confirm with the user
-        result = messagebox.askyesno(
-            "Apply Advanced Settings",
-            f"The following boot arguments will be applied:\\n\\n{boot_args}\\n\\nContinue?"
-        )
-        if result:
-            # In a real implementation, this would apply the boot arguments
-            messagebox.showinfo("Advanced Settings", "Advanced settings applied successfully.")
+    Args:
+        spec_file: Path to the spec file
+        spec_params: Parameters passed to the spec file
+        platform_name: Platform being built, used to name the work directory
+        args: Command line arguments
+    """
+    workpath = BUILD_DIR / f"pyi-work-{platform_name}"
+    clean = args.ci or args.full_rebuild
+    cmd = ["pyinstaller", "--noconfirm", "--workpath", str(workpath)]
+    if clean:
+        cmd.append("--clean")
+    cmd.append(str(spec_file))
+    
+    params_json = json.dumps(spec_params, sort_keys=True)
+    env = dict(os.environ, SKYSCOPE_SPEC_PARAMS=params_json)
+    
+    if clean:
+        run_command(cmd, env=env)
+        return
+    
+    # Seed an empty work directory from the cache entry for these inputs
+    cache_entry = PYINSTALLER_CACHE_DIR / _pyinstaller_cache_key(spec_file, params_json)
+    if cache_entry.is_dir() and not workpath.exists():
+        logging.info(f"Restoring PyInstaller work directory from {cache_entry}")
+        shutil.copytree(cache_entry, workpath)
+    
+    run_command(cmd, env=env)
+    
+    try:
+        if not cache_entry.exists():
+            shutil.copytree(workpath, cache_entry)
+        # The entry's mtime marks when it was last used
+        os.utime(cache_entry)
+        _trim_pyinstaller_cache()
+    except OSError as e:
+        logging.warning(f"Could not update PyInstaller cache: {e}")
+
+def harvest_to_wxs(src_dir, out_wxs, component_group="ProductComponents",
+                   install_dir="INSTALLFOLDER", source_var="var.SourceDir"):
+    """
+    Write a WiX fragment with a component for every file under a directory.
+    
+    Produces what `heat dir -scom -sreg -sfrag -srd -ke` would, without
+    spawning heat. Ids are derived from the relative paths, so the output is
+    stable from one build to the next.
+    
+    Args:
+        src_dir: Directory to harvest
+        out_wxs: Path of the .wxs file to write
+        component_group: Id of the ComponentGroup to create
+        install_dir: Id of the directory the files are installed into
+        source_var: Preprocessor variable holding src_dir at compile time
+    """
+    import xml.etree.ElementTree as ET
+    
+    ET.register_namespace("", WIX_NAMESPACE)
+    
+    def tag(name):
+        return f"{{{WIX_NAMESPACE}}}{name}"
+    
+    def make_id(prefix, rel_path):
+        return prefix + hashlib.blake2b(rel_path.encode(), digest_size=16).hexdigest().upper()
+    
+    wix = ET.Element(tag("Wix"))
+    directory_ref = ET.SubElement(ET.SubElement(wix, tag("Fragment")), tag("DirectoryRef"), Id=install_dir)
+    group = ET.SubElement(ET.SubElement(wix, tag("Fragment")), tag("ComponentGroup"), Id=component_group)
+    
+    # Directory element and id for each relative directory path
+    directories = {".": (directory_ref, install_dir)}
+    for root, dirs, files in os.walk(src_dir):
+        dirs.sort()
+        files.sort()
+        rel_root = os.path.relpath(root, src_dir)
+        parent, parent_id = directories[rel_root]
+        
+        for name in dirs:
+            rel_path = os.path.normpath(os.path.join(rel_root, name))
+            dir_id = make_id("dir", rel_path)
+            directories[rel_path] = (ET.SubElement(parent, tag("Directory"), Id=dir_id, Name=name), dir_id)
+        
+        for name in files:
+            rel_path = os.path.normpath(os.path.join(rel_root, name))
+            component = ET.SubElement(group, tag("Component"), Id=make_id("cmp", rel_path),
+                                      Directory=parent_id, Guid="*")
+            ET.SubElement(component, tag("File"), Id=make_id("fil", rel_path), KeyPath="yes",
+                          Source=f"$({source_var})\\{rel_path}")
+        
+        # Keep empty directories; without a key file the component needs a fixed GUID
+        if not dirs and not files and rel_root != ".":
+            guid = str(uuid.uuid5(uuid.NAMESPACE_URL, f"{install_dir}/{rel_root}")).upper()
+            component = ET.SubElement(group, tag("Component"), Id=make_id("cmp", rel_root),
+                                      Directory=parent_id, Guid=guid, KeyPath="yes")
+            ET.SubElement(component, tag("CreateFolder"))
+    
+    ET.ElementTree(wix).write(out_wxs, xml_declaration=True, encoding="utf-8")
+
+def cached_candle(wxs_file, wixobj_file, *candle_args):
+    """
+    Compile a WiX source with candle, reusing earlier output when possible.
+    
+    The .wixobj is cached under a hash of the source, the extra candle
+    arguments and the candle executable itself, so an unchanged source is
+    copied from the cache instead of being compiled again.
+    
+    Args:
+        wxs_file: WiX source to compile
+        wixobj_file: Path of the .wixobj to produce
+        candle_args: Additional arguments passed to candle
+    """
+    candle = shutil.which("candle")
+    candle_stat = os.stat(candle)
+    digest = hashlib.sha256(Path(wxs_file).read_bytes())
+    digest.update("\0".join(candle_args).encode())
+    digest.update(f"{candle}:{candle_stat.st_size}:{candle_stat.st_mtime_ns}".encode())
+    cached = WIXOBJ_CACHE_DIR / f"{digest.hexdigest()}.wixobj"
+    
+    if cached.exists():
+        logging.info(f"Using cached {Path(wixobj_file).name}")
+        _fast_copy2(cached, wixobj_file)
+        return
+    
+    run_command(["candle", str(wxs_file), "-o", str(wixobj_file), *candle_args])
+    
+    WIXOBJ_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(wixobj_file, cached)
 
-def main():
-    \"\"\"Main entry point for the application.\"\"\"
-    root = create_themed_app()
-    app = SkyscopeApp(root)
-    root.mainloop()
+def _is_macho(path):
+    """Check whether a file is a Mach-O binary (thin or universal)."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(4) in MACHO_MAGICS
+    except OSError:
+        return False
 
-if __name__ == "__main__":
-    main()
-""")
+def codesign_bundle(app_path, identity, entitlements=None):
+    """
+    Code sign an app bundle, signing its nested code in parallel.
     
-    logging.info(f"Main application file created: {app_file}")
-    return app_file
+    Instead of letting codesign --deep walk the bundle one binary at a time,
+    the nested Mach-O files are signed concurrently, then any nested
+    frameworks and apps (deepest first), and finally the bundle itself.
+    Everything is signed with the hardened runtime and a secure timestamp,
+    which notarization requires.
+    
+    Args:
+        app_path: Path to the .app bundle
+        identity: Code signing identity
+        entitlements: Optional entitlements plist, applied when it exists
+    """
+    sign_cmd = ["codesign", "--force", "--timestamp", "--options", "runtime", "--sign", identity]
+    if entitlements and Path(entitlements).exists():
+        sign_cmd += ["--entitlements", str(entitlements)]
+    
+    def sign(path):
+        run_command(sign_cmd + [str(path)])
+    
+    binaries = []
+    bundles = []
+    for root, dirs, files in os.walk(Path(app_path) / "Contents"):
+        for name in dirs:
+            if name.endswith((".framework", ".app")):
+                bundles.append(Path(root) / name)
+        for name in files:
+            path = Path(root) / name
+            if not path.is_symlink() and _is_macho(path):
+                binaries.append(path)
+    
+    logging.info(f"Signing {len(binaries)} nested binaries...")
+    if binaries:
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+            list(executor.map(sign, binaries))
+    
+    # Nested bundles seal the binaries inside them, so sign inside out
+    for bundle in sorted(bundles, key=lambda path: len(path.parts), reverse=True):
+        sign(bundle)
+    
+    sign(app_path)
+
+def notarize_and_staple(path, profile):
+    """
+    Notarize a signed artifact and staple the ticket to it.
+    
+    Args:
+        path: Path to the .dmg (or zip) to submit
+        profile: Keychain profile stored with notarytool store-credentials
+    
+    Raises:
+        RuntimeError: If Apple does not accept the submission
+    """
+    # notarytool writes upload progress to stderr and the JSON result to
+    # stdout, so they are captured separately rather than through
+    # run_command's merged stream. It also exits 0 for a rejected
+    # submission, so the status is checked as well.
+    cmd = [
+        "xcrun", "notarytool", "submit", str(path),
+        "--keychain-profile", profile,
+        "--output-format", "json",
+        "--wait"
+    ]
+    logging.debug("Running command: %s", cmd)
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    try:
+        submission = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        submission = {}
+    status = submission.get("status")
+    if result.returncode or status != "Accepted":
+        raise RuntimeError(
+            f"Notarization of {path} returned status {status!r} "
+            f"(submission {submission.get('id')}, exit code {result.returncode}); "
+            f"notarytool output: {result.stderr.strip()}"
+        )
+    run_command(["xcrun", "stapler", "staple", str(path)])
 
 # ============================================================================
 # PLATFORM-SPECIFIC BUILD FUNCTIONS
@@ -1029,142 +907,28 @@ def build_macos_app(args):
             elif tool == "dmgbuild":
                 logging.info("Installing dmgbuild...")
                 run_command([sys.executable, "-m", "pip", "install", "dmgbuild"])
+                check_tool_exists.cache_clear()
             else:
                 logging.error(f"Required tool '{tool}' not found.")
                 raise EnvironmentError(f"Required tool '{tool}' not found")
     
-    # Create PyInstaller spec file
-    spec_file = BUILD_DIR / "skyscope_macos.spec"
-    with open(spec_file, 'w') as f:
-        f.write(f"""# -*- mode: python ; coding: utf-8 -*-
-
-block_cipher = None
-
-a = Analysis(
-    ['{BUILD_DIR / "skyscope_app.py"}'],
-    pathex=['{ROOT_DIR}'],
-    binaries=[],
-    datas=[
-        ('{BUILD_DIR / "resources"}', 'resources'),
-        ('{ROOT_DIR / "skyscope-logo.png"}', 'resources'),
-        ('{ROOT_DIR / "olarila-logo.png"}', 'resources'),
-        ('{ROOT_DIR / "advanced_config.json"}', 'resources'),
-    ],
-    hiddenimports=[],
-    hookspath=[],
-    hooksconfig={{}},
-    runtime_hooks=[],
-    excludes=[],
-    win_no_prefer_redirects=False,
-    win_private_assemblies=False,
-    cipher=block_cipher,
-    noarchive=False,
-)
-
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    [],
-    exclude_binaries=True,
-    name='Skyscope',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    console=False,
-    disable_windowed_traceback=False,
-    argv_emulation=True,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-    icon='{RESOURCES_DIR / "skyscope-logo.icns"}',
-)
-
-coll = COLLECT(
-    exe,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    name='Skyscope',
-)
-
-app = BUNDLE(
-    coll,
-    name='Skyscope macOS Patcher.app',
-    icon='{RESOURCES_DIR / "skyscope-logo.icns"}',
-    bundle_identifier='{APP_IDENTIFIER}',
-    info_plist={{
-        'CFBundleShortVersionString': '{APP_VERSION}',
-        'CFBundleVersion': '{APP_VERSION}',
-        'NSPrincipalClass': 'NSApplication',
-        'NSHighResolutionCapable': 'True',
-        'LSApplicationCategoryType': '{MACOS_SETTINGS["app_category"]}',
-        'LSMinimumSystemVersion': '{MACOS_SETTINGS["min_system_version"]}',
-        'CFBundleName': '{APP_NAME}',
-        'CFBundleDisplayName': '{APP_NAME}',
-        'CFBundleGetInfoString': '{APP_DESCRIPTION}',
-        'NSHumanReadableCopyright': '{APP_COPYRIGHT}',
-    }},
-)
-""")
-    
-    # Run PyInstaller
-    logging.info("Running PyInstaller to create .app bundle...")
-    run_command(["pyinstaller", "--clean", str(spec_file)])
+    # LZFSE (ULFO) images compress and open much faster than bzip2 (UDBZ)
+    # ones, but need OS X 10.11 or later; older targets get zlib (UDZO)
+    min_version = tuple(int(part) for part in MACOS_SETTINGS["min_system_version"].split("."))
+    dmg_format = "ULFO" if min_version >= (10, 11) else "UDZO"
     
+    # Create PyInstaller spec file and DMG settings file
     app_path = DIST_DIR / "Skyscope macOS Patcher.app"
-    
-    # Code sign the app if not in CI mode and certificates are available
-    if not args.ci:
-        try:
-            logging.info("Checking for code signing identity...")
-            identities = run_command(["security", "find-identity", "-v", "-p", "codesigning"], check=False)
-            
-            if MACOS_SETTINGS["code_sign_identity"] in identities.stdout:
-                logging.info(f"Code signing with identity: {MACOS_SETTINGS['code_sign_identity']}")
-                
-                # Sign the app
-                run_command([
-                    "codesign",
-                    "--force",
-                    "--deep",
-                    "--sign", MACOS_SETTINGS["code_sign_identity"],
-                    str(app_path)
-                ])
-                
-                logging.info("Code signing completed successfully.")
-            else:
-                logging.warning("No valid code signing identity found. Skipping code signing.")
-        except Exception as e:
-            logging.error(f"Code signing failed: {e}")
-            logging.warning("Continuing without code signing...")
-    
-    # Create DMG
-    logging.info("Creating DMG installer...")
-    
-    # Check if dmgbuild is installed
-    try:
-        import dmgbuild
-    except ImportError:
-        logging.info("Installing dmgbuild...")
-        run_command([sys.executable, "-m", "pip", "install", "dmgbuild"])
-        import dmgbuild
-    
-    # Create DMG settings file
+    spec_file, spec_params = render_spec("macos")
     dmg_settings_file = BUILD_DIR / "dmg_settings.py"
-    with open(dmg_settings_file, 'w') as f:
-        f.write(f"""# -*- coding: utf-8 -*-
+    write_templates({
+        dmg_settings_file: f"""# -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
 import os.path
 
 # Volume format (see hdiutil create -help)
-format = 'UDBZ'
+format = '{dmg_format}'
 
 # Volume size
 size = None
@@ -1195,7 +959,49 @@ background_color = (0.1, 0.1, 0.1)
 
 # Window text colors (r, g, b, a)
 text_color = (1, 1, 1)
-""")
+""",
+    })
+    
+    # Run PyInstaller
+    logging.info("Running PyInstaller to create .app bundle...")
+    run_pyinstaller(spec_file, spec_params, "macos", args)
+    
+    # Code sign the app if not in CI mode and certificates are available
+    signed = False
+    if not args.ci:
+        try:
+            logging.info("Checking for code signing identity...")
+            identities = run_command(["security", "find-identity", "-v", "-p", "codesigning"], check=False, capture=True)
+            
+            if MACOS_SETTINGS["code_sign_identity"].encode() in identities.stdout:
+                logging.info(f"Code signing with identity: {MACOS_SETTINGS['code_sign_identity']}")
+                
+                # Sign the app
+                codesign_bundle(
+                    app_path,
+                    MACOS_SETTINGS["code_sign_identity"],
+                    MACOS_SETTINGS["entitlements_file"]
+                )
+                signed = True
+                
+                logging.info("Code signing completed successfully.")
+            else:
+                logging.warning("No valid code signing identity found. Skipping code signing.")
+        except Exception as e:
+            logging.error(f"Code signing failed: {e}")
+            logging.warning("Continuing without code signing...")
+    
+    # Create DMG
+    logging.info("Creating DMG installer...")
+    
+    # Check if dmgbuild is installed
+    try:
+        import dmgbuild
+    except ImportError:
+        logging.info("Installing dmgbuild...")
+        run_command([sys.executable, "-m", "pip", "install", "dmgbuild"])
+        check_tool_exists.cache_clear()
+        import dmgbuild
     
     # Build DMG
     dmg_path = DIST_DIR / f"Skyscope_macOS_Patcher_{APP_VERSION}.dmg"
@@ -1208,9 +1014,23 @@ text_color = (1, 1, 1)
     
     logging.info(f"DMG installer created: {dmg_path}")
     
+    # Notarize the DMG; the app inside was signed above, so submitting the
+    # image once covers both and the stapled ticket travels with it
+    notarized = False
+    if signed:
+        try:
+            logging.info("Notarizing DMG installer...")
+            notarize_and_staple(dmg_path, MACOS_SETTINGS["notary_profile"])
+            notarized = True
+            logging.info("Notarization completed successfully.")
+        except Exception as e:
+            logging.error(f"Notarization failed: {e}")
+    
     return {
         "app": app_path,
-        "dmg": dmg_path
+        "dmg": dmg_path,
+        "signed": signed,
+        "notarized": notarized
     }
 
 def build_windows_app(args):
@@ -1228,6 +1048,7 @@ def build_windows_app(args):
             if tool == "pyinstaller":
                 logging.info("Installing PyInstaller...")
                 run_command([sys.executable, "-m", "pip", "install", "pyinstaller"])
+                check_tool_exists.cache_clear()
             elif tool in ["candle", "light"]:
                 logging.error(f"WiX Toolset tool '{tool}' not found. Please install WiX Toolset.")
                 logging.info("Visit https://wixtoolset.org/releases/ for installation instructions.")
@@ -1236,71 +1057,11 @@ def build_windows_app(args):
                 logging.error(f"Required tool '{tool}' not found.")
                 raise EnvironmentError(f"Required tool '{tool}' not found")
     
-    # Create PyInstaller spec file
-    spec_file = BUILD_DIR / "skyscope_windows.spec"
-    with open(spec_file, 'w') as f:
-        f.write(f"""# -*- mode: python ; coding: utf-8 -*-
-
-block_cipher = None
-
-a = Analysis(
-    ['{BUILD_DIR / "skyscope_app.py"}'],
-    pathex=['{ROOT_DIR}'],
-    binaries=[],
-    datas=[
-        ('{BUILD_DIR / "resources"}', 'resources'),
-        ('{ROOT_DIR / "skyscope-logo.png"}', 'resources'),
-        ('{ROOT_DIR / "olarila-logo.png"}', 'resources'),
-        ('{ROOT_DIR / "advanced_config.json"}', 'resources'),
-    ],
-    hiddenimports=[],
-    hookspath=[],
-    hooksconfig={{}},
-    runtime_hooks=[],
-    excludes=[],
-    win_no_prefer_redirects=False,
-    win_private_assemblies=False,
-    cipher=block_cipher,
-    noarchive=False,
-)
-
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    [],
-    exclude_binaries=True,
-    name='Skyscope',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    console=False,
-    disable_windowed_traceback=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-    icon='{WINDOWS_SETTINGS["icon"]}',
-    version='{str(BUILD_DIR / "version_info.txt")}',
-)
-
-coll = COLLECT(
-    exe,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    name='Skyscope',
-)
-""")
-    
-    # Create version info file
+    # Create PyInstaller spec file and version info file
+    spec_file, spec_params = render_spec("windows")
     version_info_file = BUILD_DIR / "version_info.txt"
-    with open(version_info_file, 'w') as f:
-        f.write(f"""
+    write_templates({
+        version_info_file: f"""
 VSVersionInfo(
   ffi=FixedFileInfo(
     filevers=({APP_VERSION.replace('.', ', ')}, 0),
@@ -1330,11 +1091,12 @@ VSVersionInfo(
     VarFileInfo([VarStruct(u'Translation', [1033, 1200])])
   ]
 )
-""")
+""",
+    })
     
     # Run PyInstaller
     logging.info("Running PyInstaller to create .exe...")
-    run_command(["pyinstaller", "--clean", str(spec_file)])
+    run_pyinstaller(spec_file, spec_params, "windows", args)
     
     exe_path = DIST_DIR / "Skyscope" / "Skyscope.exe"
     
@@ -1348,8 +1110,8 @@ VSVersionInfo(
             wix_dir.mkdir(exist_ok=True)
             
             wxs_file = wix_dir / "skyscope.wxs"
-            with open(wxs_file, 'w') as f:
-                f.write(f"""<?xml version="1.0" encoding="UTF-8"?>
+            templates = {
+                wxs_file: f"""<?xml version="1.0" encoding="UTF-8"?>
 <Wix xmlns="http://schemas.microsoft.com/wix/2006/wi">
     <Product Id="*" 
              Name="{APP_NAME}" 
@@ -1441,20 +1203,22 @@ VSVersionInfo(
         </ComponentGroup>
     </Fragment>
 </Wix>
-""")
+""",
+            }
             
             # Create a simple license file if it doesn't exist
             license_file = BUILD_DIR / "license.rtf"
             if not license_file.exists():
-                with open(license_file, 'w') as f:
-                    f.write("""{\\rtf1\\ansi\\ansicpg1252\\deff0\\nouicompat\\deflang1033{\\fonttbl{\\f0\\fnil\\fcharset0 Calibri;}}
+                templates[license_file] = """{\\rtf1\\ansi\\ansicpg1252\\deff0\\nouicompat\\deflang1033{\\fonttbl{\\f0\\fnil\\fcharset0 Calibri;}}
 {\\*\\generator Riched20 10.0.19041}\\viewkind4\\uc1 
 \\pard\\sa200\\sl276\\slmult1\\f0\\fs22\\lang9 Skyscope macOS Patcher License\\par
 Copyright (c) 2025 Miss Casey Jay Topojani\\par
 Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:\\par
 The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.\\par
 THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.\\par
-}""")
+}"""
+            
+            write_templates(templates)
             
             # Create banner and dialog bitmaps
             # In a real implementation, these would be proper images
@@ -1462,39 +1226,37 @@ THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLI
             banner_file = BUILD_DIR / "banner.bmp"
             dialog_file = BUILD_DIR / "dialog.bmp"
             
-            if not banner_file.exists():
-                run_command(["convert", "-size", "493x58", "xc:navy", str(banner_file)], check=False)
-            
-            if not dialog_file.exists():
-                run_command(["convert", "-size", "493x312", "xc:navy", str(dialog_file)], check=False)
+            if not (banner_file.exists() and dialog_file.exists()):
+                from PIL import Image
+                if not banner_file.exists():
+                    Image.new("RGB", (493, 58), (0, 0, 128)).save(banner_file, "BMP")
+                if not dialog_file.exists():
+                    Image.new("RGB", (493, 312), (0, 0, 128)).save(dialog_file, "BMP")
             
             # Run WiX tools to create MSI
             # First, harvest files from PyInstaller output
             wxs_components = wix_dir / "components.wxs"
-            run_command([
-                "heat", "dir", str(DIST_DIR / "Skyscope"),
-                "-cg", "ProductComponents",
-                "-dr", "INSTALLFOLDER",
-                "-gg", "-scom", "-sreg", "-sfrag", "-srd", "-ke", "-var", "var.SourceDir",
-                "-out", str(wxs_components)
-            ])
+            harvest_to_wxs(DIST_DIR / "Skyscope", wxs_components)
             
             # Compile WiX sources
             wixobj_file = wix_dir / "skyscope.wixobj"
             wixobj_components = wix_dir / "components.wixobj"
             
-            run_command([
-                "candle", str(wxs_file),
-                "-o", str(wixobj_file),
-                "-ext", "WixUIExtension"
-            ])
-            
-            run_command([
-                "candle", str(wxs_components),
-                "-o", str(wixobj_components),
-                "-dSourceDir=" + str(DIST_DIR / "Skyscope"),
-                "-ext", "WixUIExtension"
-            ])
+            # The two sources compile independently, so run candle on both at once
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(
+                        cached_candle, wxs_file, wixobj_file,
+                        "-ext", "WixUIExtension"
+                    ),
+                    executor.submit(
+                        cached_candle, wxs_components, wixobj_components,
+                        "-dSourceDir=" + str(DIST_DIR / "Skyscope"),
+                        "-ext", "WixUIExtension"
+                    ),
+                ]
+                for future in as_completed(futures):
+                    future.result()
             
             # Link WiX objects to create MSI
             msi_path = DIST_DIR / f"Skyscope_macOS_Patcher_{APP_VERSION}.msi"
@@ -1533,6 +1295,7 @@ def build_linux_app(args):
             if tool == "pyinstaller":
                 logging.info("Installing PyInstaller...")
                 run_command([sys.executable, "-m", "pip", "install", "pyinstaller"])
+                check_tool_exists.cache_clear()
             elif tool == "appimagetool":
                 logging.error("appimagetool not found. Please install appimagetool.")
                 logging.info("Visit https://appimage.github.io/appimagetool/ for installation instructions.")
@@ -1542,67 +1305,11 @@ def build_linux_app(args):
                 raise EnvironmentError(f"Required tool '{tool}' not found")
     
     # Create PyInstaller spec file
-    spec_file = BUILD_DIR / "skyscope_linux.spec"
-    with open(spec_file, 'w') as f:
-        f.write(f"""# -*- mode: python ; coding: utf-8 -*-
-
-block_cipher = None
-
-a = Analysis(
-    ['{BUILD_DIR / "skyscope_app.py"}'],
-    pathex=['{ROOT_DIR}'],
-    binaries=[],
-    datas=[
-        ('{BUILD_DIR / "resources"}', 'resources'),
-        ('{ROOT_DIR / "skyscope-logo.png"}', 'resources'),
-        ('{ROOT_DIR / "olarila-logo.png"}', 'resources'),
-        ('{ROOT_DIR / "advanced_config.json"}', 'resources'),
-    ],
-    hiddenimports=[],
-    hookspath=[],
-    hooksconfig={{}},
-    runtime_hooks=[],
-    excludes=[],
-    win_no_prefer_redirects=False,
-    win_private_assemblies=False,
-    cipher=block_cipher,
-    noarchive=False,
-)
-
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    [],
-    exclude_binaries=True,
-    name='Skyscope',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    console=False,
-    disable_windowed_traceback=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-)
-
-coll = COLLECT(
-    exe,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    name='Skyscope',
-)
-""")
+    spec_file, spec_params = render_spec("linux")
     
     # Run PyInstaller
     logging.info("Running PyInstaller to create Linux executable...")
-    run_command(["pyinstaller", "--clean", str(spec_file)])
+    run_pyinstaller(spec_file, spec_params, "linux", args)
     
     exe_path = DIST_DIR / "Skyscope" / "Skyscope"
     
@@ -1616,12 +1323,19 @@ coll = COLLECT(
             appdir.mkdir(exist_ok=True)
             
             # Copy PyInstaller output to AppDir
-            run_command(["cp", "-r", str(DIST_DIR / "Skyscope"), str(appdir / "usr")])
+            shutil.copytree(DIST_DIR / "Skyscope", appdir / "usr", copy_function=_link_or_copy, dirs_exist_ok=True)
             
-            # Create .desktop file
+            # Copy icon
+            os.makedirs(appdir / "usr" / "share" / "icons" / "hicolor" / "256x256" / "apps", exist_ok=True)
+            shutil.copy2(
+                LINUX_SETTINGS["icon"],
+                appdir / "usr" / "share" / "icons" / "hicolor" / "256x256" / "apps" / "skyscope.png"
+            )
+            
+            # Create .desktop file and AppRun script
             os.makedirs(appdir / "usr" / "share" / "applications", exist_ok=True)
-            with open(appdir / "usr" / "share" / "applications" / "skyscope.desktop", 'w') as f:
-                f.write(f"""[Desktop Entry]
+            write_templates({
+                appdir / "usr" / "share" / "applications" / "skyscope.desktop": f"""[Desktop Entry]
 Name={APP_NAME}
 Exec=Skyscope
 Icon=skyscope
@@ -1630,25 +1344,16 @@ Categories={LINUX_SETTINGS["categories"]}
 Terminal={str(LINUX_SETTINGS["terminal"]).lower()}
 StartupNotify=true
 Comment={APP_DESCRIPTION}
-""")
-            
-            # Copy icon
-            os.makedirs(appdir / "usr" / "share" / "icons" / "hicolor" / "256x256" / "apps", exist_ok=True)
-            shutil.copy2(
-                LINUX_SETTINGS["icon"],
-                appdir / "usr" / "share" / "icons" / "hicolor" / "256x256" / "apps" / "skyscope.png"
-            )
-            
-            # Create AppRun script
-            with open(appdir / "AppRun", 'w') as f:
-                f.write("""#!/bin/sh
+""",
+                appdir / "AppRun": """#!/bin/sh
 SELF=$(readlink -f "$0")
 HERE=${SELF%/*}
 export PATH="${HERE}/usr/bin:${HERE}/usr/sbin:${PATH}"
 export LD_LIBRARY_PATH="${HERE}/usr/lib:${LD_LIBRARY_PATH}"
 export XDG_DATA_DIRS="${HERE}/usr/share:${XDG_DATA_DIRS}"
 exec "${HERE}/usr/Skyscope" "$@"
-""")
+""",
+            })
             
             # Make AppRun executable
             os.chmod(appdir / "AppRun", 0o755)
@@ -1666,8 +1371,15 @@ exec "${HERE}/usr/Skyscope" "$@"
             
             # Run appimagetool
             appimage_path = DIST_DIR / f"Skyscope_macOS_Patcher_{APP_VERSION}.AppImage"
+            # Compress on every core, with squashfs' largest block size so
+            # zstd gets more data per block
             run_command([
                 "appimagetool",
+                "--comp", "zstd",
+                "--mksquashfs-opt", "-processors",
+                "--mksquashfs-opt", str(os.cpu_count() or 1),
+                "--mksquashfs-opt", "-b",
+                "--mksquashfs-opt", "1M",
                 str(appdir),
                 str(appimage_path)
             ])
@@ -1724,6 +1436,12 @@ def main():
         help="Skip dependency installation"
     )
     
+    parser.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help="Discard PyInstaller's cached build state (always done in CI mode)"
+    )
+    
     args = parser.parse_args()
     
     # Setup logging
@@ -1742,28 +1460,30 @@ def main():
         if not args.skip_deps:
             install_python_packages()
         
-        # Copy resources
-        copy_resources()
-        
-        # Create version file
-        create_version_file()
-        
-        # Create dark theme file
-        create_dark_theme_file()
-        
-        # Create main app file
-        create_main_app_file()
+        # Copy resources and create the version, dark theme and main app
+        # files; the steps are independent, so overlap their I/O
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(step) for step in (
+                    copy_resources,
+                    create_version_file,
+                    create_dark_theme_file,
+                    create_main_app_file,
+                )
+            ]
+            for future in as_completed(futures):
+                future.result()
         
         # Build for selected platform(s)
         results = {}
         
-        if args.platform in ["all", "macos"] and platform.system() == "Darwin":
+        if args.platform in ["all", "macos"] and CURRENT_PLATFORM == "macos":
             results["macos"] = build_macos_app(args)
         
-        if args.platform in ["all", "windows"] and platform.system() == "Windows":
+        if args.platform in ["all", "windows"] and CURRENT_PLATFORM == "windows":
             results["windows"] = build_windows_app(args)
         
-        if args.platform in ["all", "linux"] and platform.system() == "Linux":
+        if args.platform in ["all", "linux"] and CURRENT_PLATFORM == "linux":
             results["linux"] = build_linux_app(args)
         
         # Print summary
@@ -1773,6 +1493,10 @@ def main():
             logger.info("macOS:")
             logger.info(f"  .app bundle: {results['macos']['app']}")
             logger.info(f"  .dmg installer: {results['macos']['dmg']}")
+            if results['macos']['notarized']:
+                logger.info("  notarized: yes")
+            elif results['macos']['signed']:
+                logger.error("  notarized: NO - the signed DMG was not accepted by Apple")
         
         if "windows" in results:
             logger.info("Windows:")
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+dark_theme.py - Dark theme implementation for Skyscope macOS Patcher
+"""
+
+import sys
+import subprocess
+import functools
+import tkinter as tk
+from tkinter import ttk
+
+# Theme colors
+DARK_BG = "#1A1A1A"
+DARK_FG = "#ECF0F1"
+BUTTON_BG = "#3498DB"
+BUTTON_HOVER = "#2980B9"
+FRAME_BG = "#2C3E50"
+ENTRY_BG = "#34495E"
+ENTRY_FG = "#ECF0F1"
+
+# ttk theme created by set_dark_theme and its per-style settings
+THEME_NAME = "skyscope_dark"
+THEME_STYLES = {
+    ".": {
+        "configure": {
+            "background": DARK_BG,
+            "foreground": DARK_FG,
+            "fieldbackground": ENTRY_BG,
+            "troughcolor": FRAME_BG,
+        },
+    },
+    "TButton": {
+        "configure": {"background": BUTTON_BG, "foreground": DARK_FG},
+        "map": {"background": [("active", BUTTON_HOVER), ("disabled", FRAME_BG)]},
+    },
+    "TFrame": {"configure": {"background": FRAME_BG}},
+    "TLabel": {"configure": {"background": FRAME_BG, "foreground": DARK_FG}},
+    "TEntry": {"configure": {"fieldbackground": ENTRY_BG, "foreground": ENTRY_FG}},
+}
+
+def set_dark_theme(root):
+    """Apply dark theme to the tkinter application."""
+    # ttkthemes is imported lazily by create_themed_app, so a ThemedTk root
+    # can only exist once the module is loaded
+    ttkthemes = sys.modules.get("ttkthemes")
+    if ttkthemes is not None and isinstance(root, ttkthemes.ThemedTk):
+        root.set_theme("equilux")  # A dark theme from ttkthemes
+    
+    style = ttk.Style(root)
+    
+    # Configure the theme colors as a theme derived from the current one,
+    # so Tk applies every style setting in a single call
+    if THEME_NAME not in style.theme_names():
+        style.theme_create(THEME_NAME, parent=style.theme_use(), settings=THEME_STYLES)
+    style.theme_use(THEME_NAME)
+    
+    # Set root window background
+    root.configure(background=DARK_BG)
+    
+    return style
+
+@functools.lru_cache(maxsize=1)
+def _macos_dark_mode():
+    """Read the macOS appearance setting once per session."""
+    try:
+        result = subprocess.run(
+            ["defaults", "read", "-g", "AppleInterfaceStyle"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True
+        )
+        return result.returncode == 0 and result.stdout.strip() == "Dark"
+    except OSError:
+        return False
+
+@functools.lru_cache(maxsize=1)
+def _windows_dark_mode():
+    """Read the Windows app theme setting once per session."""
+    try:
+        import winreg
+        with winreg.OpenKey(
+            winreg.HKEY_CURRENT_USER,
+            r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize"
+        ) as key:
+            value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
+        return value == 0
+    except OSError:
+        return False
+
+def is_dark_mode():
+    """Detect if the system is in dark mode."""
+    try:
+        # Imported here so startup doesn't pay for it unless it's needed
+        import darkdetect
+        return darkdetect.isDark()
+    except:
+        # Fallback if darkdetect fails
+        if sys.platform == "darwin":
+            # macOS detection fallback
+            return _macos_dark_mode()
+        elif sys.platform == "win32":
+            # Windows detection fallback
+            return _windows_dark_mode()
+        else:
+            # Linux and other platforms - no reliable fallback
+            return False
+
+def create_themed_app(title="Skyscope macOS Patcher"):
+    """Create a themed tkinter application."""
+    try:
+        # Try to use ThemedTk for better theme support
+        from ttkthemes import ThemedTk
+        root = ThemedTk(theme="equilux")
+    except:
+        # Fallback to standard Tk
+        root = tk.Tk()
+    
+    root.title(title)
+    root.minsize(800, 600)
+    
+    # Center window on screen
+    screen_width = root.winfo_screenwidth()
+    screen_height = root.winfo_screenheight()
+    width = 900
+    height = 700
+    x = (screen_width - width) // 2
+    y = (screen_height - height) // 2
+    root.geometry(f"{width}x{height}+{x}+{y}")
+    
+    # Apply dark theme
+    set_dark_theme(root)
+    
+    return root
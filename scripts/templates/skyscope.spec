@@ -0,0 +1,78 @@
+# -*- mode: python ; coding: utf-8 -*-
+#
+# Shared PyInstaller spec for the macOS, Windows and Linux builds.
+# build_gui_apps.py passes the values that differ between builds as JSON in
+# the SKYSCOPE_SPEC_PARAMS environment variable, so this file never changes.
+
+import json
+import os
+
+params = json.loads(os.environ["SKYSCOPE_SPEC_PARAMS"])
+target = params["target"]
+
+block_cipher = None
+
+a = Analysis(
+    [params["script"]],
+    pathex=[params["root_dir"]],
+    binaries=[],
+    datas=[tuple(data) for data in params["datas"]],
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=params["excludes"],
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    cipher=block_cipher,
+    noarchive=False,
+)
+
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+
+# Options only some platforms set
+exe_options = {}
+if target == "macos":
+    exe_options["argv_emulation"] = True
+if "icon" in params:
+    exe_options["icon"] = params["icon"]
+if "version_file" in params:
+    exe_options["version"] = params["version_file"]
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='Skyscope',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=params["strip"],
+    upx=False,
+    console=False,
+    disable_windowed_traceback=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    **exe_options
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=params["strip"],
+    upx=False,
+    upx_exclude=[],
+    name='Skyscope',
+)
+
+if target == "macos":
+    app = BUNDLE(
+        coll,
+        name=params["bundle_name"],
+        icon=params["icon"],
+        bundle_identifier=params["bundle_identifier"],
+        info_plist=params["info_plist"],
+    )
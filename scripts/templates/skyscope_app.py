@@ -0,0 +1,704 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+skyscope_app.py - Main GUI application for Skyscope macOS Patcher
+"""
+
+import os
+import sys
+import json
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+import platform
+import functools
+from pathlib import Path
+
+# Host platform, checked once
+IS_MAC = sys.platform == "darwin"
+IS_WIN = sys.platform == "win32"
+
+# dark_theme is written next to this file, whose directory is already first
+# on sys.path when run as a script (and for PyInstaller's analysis)
+try:
+    from dark_theme import create_themed_app, set_dark_theme
+except ImportError:
+    # Fallback if dark_theme module is not available
+    def create_themed_app(title="Skyscope macOS Patcher"):
+        root = tk.Tk()
+        root.title(title)
+        root.minsize(800, 600)
+        return root
+    
+    def set_dark_theme(root):
+        return ttk.Style(root)
+
+# Pillow modules, imported on first use by _pil()
+_PIL_Image = None
+_PIL_ImageTk = None
+
+def _pil():
+    """Import Pillow's Image and ImageTk modules on first use."""
+    global _PIL_Image, _PIL_ImageTk
+    if _PIL_Image is None:
+        from PIL import Image, ImageTk
+        _PIL_Image, _PIL_ImageTk = Image, ImageTk
+    return _PIL_Image, _PIL_ImageTk
+
+@functools.lru_cache(maxsize=1)
+def get_system_info():
+    """
+    Collect basic system information once per session.
+    
+    A single platform.uname() call backs every field (os.uname() is not
+    available on Windows); on macOS the CPU name comes from sysctl, as
+    platform.processor() usually returns only the architecture there.
+    """
+    uname = platform.uname()
+    processor = None
+    if uname.system == "Darwin":
+        try:
+            result = subprocess.run(
+                ["sysctl", "-n", "machdep.cpu.brand_string"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                universal_newlines=True
+            )
+            processor = result.stdout.strip()
+        except OSError:
+            pass
+    
+    return {
+        "System": uname.system,
+        "Node": uname.node,
+        "Release": uname.release,
+        "Version": uname.version,
+        "Machine": uname.machine,
+        "Processor": processor or uname.processor
+    }
+
+@functools.lru_cache(maxsize=1)
+def get_sip_status():
+    """
+    Read the csrutil status output once per session.
+    
+    SIP can only be changed from recoveryOS, so the result holds until the
+    next reboot. Failures raise and are not cached.
+    """
+    result = subprocess.run(
+        ["csrutil", "status"],
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+    return result.stdout
+
+@functools.lru_cache(maxsize=8)
+def load_json_config(path, mtime):
+    """
+    Parse a JSON configuration file, reusing the result while it is unchanged.
+    
+    The modification time is part of the cache key, so an edited file is
+    parsed again. The returned dict is shared between callers and must not
+    be modified in place.
+    """
+    return json.loads(Path(path).read_bytes())
+
+class SkyscopeApp:
+    """Main application class for Skyscope macOS Patcher."""
+    
+    # Dashboard logo, shared by every instance once decoded
+    _logo_photo = None
+    
+    def __init__(self, root):
+        self.root = root
+        self.style = set_dark_theme(root)
+        
+        # Shared worker threads for background tasks such as hardware detection
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="skyscope-bg")
+        
+        # Set application icon
+        try:
+            if IS_MAC:
+                # macOS specific icon handling
+                icon_path = self.get_resource_path("skyscope-logo.png")
+                if os.path.exists(icon_path):
+                    Image, ImageTk = _pil()
+                    icon = ImageTk.PhotoImage(Image.open(icon_path))
+                    self.root.iconphoto(True, icon)
+            elif IS_WIN:
+                # Windows specific icon handling
+                icon_path = self.get_resource_path("skyscope-logo.ico")
+                if os.path.exists(icon_path):
+                    self.root.iconbitmap(icon_path)
+            else:
+                # Linux icon handling
+                icon_path = self.get_resource_path("skyscope-logo.png")
+                if os.path.exists(icon_path):
+                    Image, ImageTk = _pil()
+                    icon = ImageTk.PhotoImage(Image.open(icon_path))
+                    self.root.iconphoto(True, icon)
+        except Exception as e:
+            print(f"Warning: Could not set application icon: {e}")
+        
+        self.create_menu()
+        self.create_notebook()
+        self.load_config()
+        
+    def get_logo_photo(self):
+        """Get the 200x200 dashboard logo, decoding it only once."""
+        cls = type(self)
+        if cls._logo_photo is None:
+            Image, ImageTk = _pil()
+            # The build ships a pre-sized copy so no resampling is needed here
+            logo_path = self.get_resource_path("skyscope-logo@200.png")
+            if os.path.exists(logo_path):
+                logo_img = Image.open(logo_path)
+            else:
+                logo_path = self.get_resource_path("skyscope-logo.png")
+                if not os.path.exists(logo_path):
+                    return None
+                resample = getattr(Image, "Resampling", Image).LANCZOS
+                logo_img = Image.open(logo_path).resize((200, 200), resample)
+            cls._logo_photo = ImageTk.PhotoImage(logo_img)
+        return cls._logo_photo
+    
+    def get_resource_path(self, filename):
+        """Get the path to a resource file."""
+        # Check if running as a PyInstaller bundle
+        if getattr(sys, 'frozen', False):
+            # Running as compiled bundle
+            bundle_dir = Path(sys._MEIPASS)
+            return str(bundle_dir / "resources" / filename)
+        else:
+            # Running as script
+            script_dir = Path(os.path.dirname(os.path.abspath(__file__)))
+            root_dir = script_dir.parent
+            return str(root_dir / "resources" / filename)
+    
+    def load_config(self):
+        """Load configuration from advanced_config.json."""
+        try:
+            config_path = self.get_resource_path("advanced_config.json")
+            if os.path.exists(config_path):
+                self.config = load_json_config(config_path, os.path.getmtime(config_path))
+                print(f"Configuration loaded from {config_path}")
+            else:
+                print(f"Configuration file not found: {config_path}")
+                self.config = {}
+        except Exception as e:
+            print(f"Error loading configuration: {e}")
+            self.config = {}
+    
+    def create_menu(self):
+        """Create the application menu."""
+        menubar = tk.Menu(self.root)
+        
+        # File menu
+        file_menu = tk.Menu(menubar, tearoff=0)
+        file_menu.add_command(label="Open Config...", command=self.open_config)
+        file_menu.add_command(label="Save Config...", command=self.save_config)
+        file_menu.add_separator()
+        file_menu.add_command(label="Exit", command=self.root.quit)
+        menubar.add_cascade(label="File", menu=file_menu)
+        
+        # Tools menu
+        tools_menu = tk.Menu(menubar, tearoff=0)
+        tools_menu.add_command(label="Create USB Installer", command=self.create_usb_installer)
+        tools_menu.add_command(label="Install Kexts", command=self.install_kexts)
+        tools_menu.add_command(label="Extract Linux Drivers", command=self.extract_linux_drivers)
+        menubar.add_cascade(label="Tools", menu=tools_menu)
+        
+        # Help menu
+        help_menu = tk.Menu(menubar, tearoff=0)
+        help_menu.add_command(label="Documentation", command=self.show_documentation)
+        help_menu.add_command(label="About", command=self.show_about)
+        menubar.add_cascade(label="Help", menu=help_menu)
+        
+        self.root.config(menu=menubar)
+    
+    def create_notebook(self):
+        """Create the main tabbed interface."""
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Create tabs
+        self.dashboard_tab = ttk.Frame(self.notebook)
+        self.hardware_tab = ttk.Frame(self.notebook)
+        self.installer_tab = ttk.Frame(self.notebook)
+        self.patches_tab = ttk.Frame(self.notebook)
+        self.advanced_tab = ttk.Frame(self.notebook)
+        
+        self.notebook.add(self.dashboard_tab, text="Dashboard")
+        self.notebook.add(self.hardware_tab, text="Hardware")
+        self.notebook.add(self.installer_tab, text="Installer")
+        self.notebook.add(self.patches_tab, text="Patches")
+        self.notebook.add(self.advanced_tab, text="Advanced")
+        
+        # Initialize tabs
+        self.init_dashboard_tab()
+        self.init_hardware_tab()
+        self.init_installer_tab()
+        self.init_patches_tab()
+        self.init_advanced_tab()
+    
+    def init_dashboard_tab(self):
+        """Initialize the Dashboard tab."""
+        # Logo
+        try:
+            logo_photo = self.get_logo_photo()
+            if logo_photo is not None:
+                # The class attribute keeps the image from being garbage collected
+                logo_label = ttk.Label(self.dashboard_tab, image=logo_photo)
+                logo_label.pack(pady=20)
+        except Exception as e:
+            print(f"Warning: Could not load logo: {e}")
+        
+        # Welcome text
+        welcome_label = ttk.Label(
+            self.dashboard_tab, 
+            text="Welcome to Skyscope macOS Patcher",
+            font=("Helvetica", 16)
+        )
+        welcome_label.pack(pady=10)
+        
+        version_label = ttk.Label(
+            self.dashboard_tab,
+            text=f"Version 1.0.0",
+            font=("Helvetica", 12)
+        )
+        version_label.pack()
+        
+        # Quick actions frame
+        actions_frame = ttk.LabelFrame(self.dashboard_tab, text="Quick Actions")
+        actions_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Create buttons for quick actions
+        create_installer_btn = ttk.Button(
+            actions_frame, 
+            text="Create macOS Installer",
+            command=lambda: self.notebook.select(self.installer_tab)
+        )
+        create_installer_btn.pack(fill=tk.X, padx=20, pady=10)
+        
+        install_kexts_btn = ttk.Button(
+            actions_frame,
+            text="Install Kexts",
+            command=self.install_kexts
+        )
+        install_kexts_btn.pack(fill=tk.X, padx=20, pady=10)
+        
+        hardware_check_btn = ttk.Button(
+            actions_frame,
+            text="Check Hardware Compatibility",
+            command=lambda: self.notebook.select(self.hardware_tab)
+        )
+        hardware_check_btn.pack(fill=tk.X, padx=20, pady=10)
+    
+    def init_hardware_tab(self):
+        """Initialize the Hardware tab."""
+        # Hardware detection section
+        detect_frame = ttk.LabelFrame(self.hardware_tab, text="Hardware Detection")
+        detect_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        detect_btn = ttk.Button(
+            detect_frame,
+            text="Detect Hardware",
+            command=self.detect_hardware
+        )
+        detect_btn.pack(padx=20, pady=10)
+        
+        # Hardware info display
+        self.hw_info = tk.Text(detect_frame, height=20, wrap=tk.WORD)
+        self.hw_info.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+        
+        # Set initial text
+        self.hw_info.insert(tk.END, "Click 'Detect Hardware' to scan your system...")
+        self.hw_info.config(state=tk.DISABLED)
+    
+    def init_installer_tab(self):
+        """Initialize the Installer tab."""
+        # macOS version selection
+        version_frame = ttk.LabelFrame(self.installer_tab, text="macOS Version")
+        version_frame.pack(fill=tk.X, padx=20, pady=20)
+        
+        self.macos_version = tk.StringVar(value="Sequoia")
+        sequoia_radio = ttk.Radiobutton(
+            version_frame,
+            text="macOS Sequoia",
+            variable=self.macos_version,
+            value="Sequoia"
+        )
+        tahoe_radio = ttk.Radiobutton(
+            version_frame,
+            text="macOS Tahoe",
+            variable=self.macos_version,
+            value="Tahoe"
+        )
+        
+        sequoia_radio.pack(anchor=tk.W, padx=20, pady=5)
+        tahoe_radio.pack(anchor=tk.W, padx=20, pady=5)
+        
+        # Installer options
+        options_frame = ttk.LabelFrame(self.installer_tab, text="Installer Options")
+        options_frame.pack(fill=tk.X, padx=20, pady=20)
+        
+        self.shrink_installer = tk.BooleanVar(value=True)
+        shrink_check = ttk.Checkbutton(
+            options_frame,
+            text="Shrink Installer (remove extra languages)",
+            variable=self.shrink_installer
+        )
+        shrink_check.pack(anchor=tk.W, padx=20, pady=5)
+        
+        self.include_nvidia = tk.BooleanVar(value=True)
+        nvidia_check = ttk.Checkbutton(
+            options_frame,
+            text="Include NVIDIA GTX 970 Support",
+            variable=self.include_nvidia
+        )
+        nvidia_check.pack(anchor=tk.W, padx=20, pady=5)
+        
+        self.include_arc = tk.BooleanVar(value=True)
+        arc_check = ttk.Checkbutton(
+            options_frame,
+            text="Include Intel Arc A770 Support",
+            variable=self.include_arc
+        )
+        arc_check.pack(anchor=tk.W, padx=20, pady=5)
+        
+        # USB device selection
+        usb_frame = ttk.LabelFrame(self.installer_tab, text="USB Device")
+        usb_frame.pack(fill=tk.X, padx=20, pady=20)
+        
+        usb_select_btn = ttk.Button(
+            usb_frame,
+            text="Select USB Device",
+            command=self.select_usb_device
+        )
+        usb_select_btn.pack(padx=20, pady=10)
+        
+        self.usb_label = ttk.Label(usb_frame, text="No device selected")
+        self.usb_label.pack(padx=20, pady=5)
+        
+        # Create button
+        create_btn = ttk.Button(
+            self.installer_tab,
+            text="Create Bootable Installer",
+            command=self.create_bootable_installer
+        )
+        create_btn.pack(padx=20, pady=20)
+    
+    def init_patches_tab(self):
+        """Initialize the Patches tab."""
+        # Patch categories
+        categories_frame = ttk.LabelFrame(self.patches_tab, text="Patch Categories")
+        categories_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # GPU patches
+        gpu_frame = ttk.LabelFrame(categories_frame, text="GPU Patches")
+        gpu_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.nvidia_patch = tk.BooleanVar(value=True)
+        nvidia_check = ttk.Checkbutton(
+            gpu_frame,
+            text="NVIDIA GTX 970 Acceleration",
+            variable=self.nvidia_patch
+        )
+        nvidia_check.pack(anchor=tk.W, padx=10, pady=5)
+        
+        self.arc_patch = tk.BooleanVar(value=True)
+        arc_check = ttk.Checkbutton(
+            gpu_frame,
+            text="Intel Arc A770 Acceleration",
+            variable=self.arc_patch
+        )
+        arc_check.pack(anchor=tk.W, padx=10, pady=5)
+        
+        # CPU patches
+        cpu_frame = ttk.LabelFrame(categories_frame, text="CPU Patches")
+        cpu_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.alder_lake_patch = tk.BooleanVar(value=True)
+        alder_check = ttk.Checkbutton(
+            cpu_frame,
+            text="Alder Lake Support",
+            variable=self.alder_lake_patch
+        )
+        alder_check.pack(anchor=tk.W, padx=10, pady=5)
+        
+        self.raptor_lake_patch = tk.BooleanVar(value=True)
+        raptor_check = ttk.Checkbutton(
+            cpu_frame,
+            text="Raptor Lake Support",
+            variable=self.raptor_lake_patch
+        )
+        raptor_check.pack(anchor=tk.W, padx=10, pady=5)
+        
+        # Apply button
+        apply_btn = ttk.Button(
+            self.patches_tab,
+            text="Apply Selected Patches",
+            command=self.apply_patches
+        )
+        apply_btn.pack(padx=20, pady=20)
+    
+    def init_advanced_tab(self):
+        """Initialize the Advanced tab."""
+        # Boot arguments
+        bootargs_frame = ttk.LabelFrame(self.advanced_tab, text="Boot Arguments")
+        bootargs_frame.pack(fill=tk.X, padx=20, pady=20)
+        
+        self.bootargs_entry = ttk.Entry(bootargs_frame, width=50)
+        self.bootargs_entry.pack(fill=tk.X, padx=10, pady=10)
+        self.bootargs_entry.insert(0, "ngfxcompat=1 ngfxgl=1 nvda_drv_vrl=1 iarccompat=1 iarcgl=1 -v")
+        
+        # SIP settings
+        sip_frame = ttk.LabelFrame(self.advanced_tab, text="System Integrity Protection")
+        sip_frame.pack(fill=tk.X, padx=20, pady=20)
+        
+        self.sip_status = tk.StringVar(value="Unknown")
+        sip_label = ttk.Label(sip_frame, text="SIP Status:")
+        sip_label.pack(side=tk.LEFT, padx=10, pady=10)
+        
+        sip_status_label = ttk.Label(sip_frame, textvariable=self.sip_status)
+        sip_status_label.pack(side=tk.LEFT, padx=10, pady=10)
+        
+        check_sip_btn = ttk.Button(
+            sip_frame,
+            text="Check SIP Status",
+            command=self.check_sip_status
+        )
+        check_sip_btn.pack(side=tk.RIGHT, padx=10, pady=10)
+        
+        # Debug logging
+        debug_frame = ttk.LabelFrame(self.advanced_tab, text="Debug Logging")
+        debug_frame.pack(fill=tk.X, padx=20, pady=20)
+        
+        self.debug_enabled = tk.BooleanVar(value=False)
+        debug_check = ttk.Checkbutton(
+            debug_frame,
+            text="Enable Debug Logging",
+            variable=self.debug_enabled,
+            command=self.toggle_debug
+        )
+        debug_check.pack(anchor=tk.W, padx=10, pady=10)
+        
+        # Apply button
+        apply_btn = ttk.Button(
+            self.advanced_tab,
+            text="Apply Advanced Settings",
+            command=self.apply_advanced_settings
+        )
+        apply_btn.pack(padx=20, pady=20)
+    
+    # Action methods
+    def open_config(self):
+        """Open and load a configuration file."""
+        file_path = filedialog.askopenfilename(
+            title="Open Configuration File",
+            filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
+        )
+        if file_path:
+            try:
+                with open(file_path, 'r') as f:
+                    self.config = json.load(f)
+                messagebox.showinfo("Success", "Configuration loaded successfully.")
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load configuration: {e}")
+    
+    def save_config(self):
+        """Save the current configuration to a file."""
+        file_path = filedialog.asksaveasfilename(
+            title="Save Configuration File",
+            defaultextension=".json",
+            filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
+        )
+        if file_path:
+            try:
+                # Serialize up front so the file is written in one call
+                Path(file_path).write_bytes(json.dumps(self.config, indent=2).encode("utf-8"))
+                messagebox.showinfo("Success", "Configuration saved successfully.")
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to save configuration: {e}")
+    
+    def create_usb_installer(self):
+        """Launch the USB installer creation tool."""
+        messagebox.showinfo("USB Installer", "This will launch the USB installer creation tool.")
+        # In a real implementation, this would call the USB creator functionality
+    
+    def install_kexts(self):
+        """Install kexts to the system."""
+        if not IS_MAC:
+            messagebox.showerror("Error", "Kext installation is only supported on macOS.")
+            return
+        
+        result = messagebox.askyesno(
+            "Install Kexts",
+            "This will install kexts to your system. Administrator privileges are required. Continue?"
+        )
+        if result:
+            # In a real implementation, this would call the kext installer functionality
+            messagebox.showinfo("Kext Installation", "Kext installation started. This may take a few minutes.")
+    
+    def extract_linux_drivers(self):
+        """Extract drivers from Linux packages."""
+        messagebox.showinfo("Extract Drivers", "This will extract drivers from Linux packages.")
+        # In a real implementation, this would call the Linux driver extractor
+    
+    def show_documentation(self):
+        """Show the documentation."""
+        messagebox.showinfo("Documentation", "Documentation will be displayed here.")
+        # In a real implementation, this would open the documentation
+    
+    def show_about(self):
+        """Show the about dialog."""
+        about_text = f"Skyscope macOS Patcher\nVersion 1.0.0\n\nDeveloped by Miss Casey Jay Topojani\n\n" +                     "A toolkit for enabling NVIDIA GTX 970 and Intel Arc A770 graphics\n" +                     "acceleration in macOS Sequoia and Tahoe."
+        messagebox.showinfo("About", about_text)
+    
+    def detect_hardware(self):
+        """Detect system hardware."""
+        self.hw_info.config(state=tk.NORMAL)
+        self.hw_info.delete(1.0, tk.END)
+        self.hw_info.insert(tk.END, "Detecting hardware...\n\n")
+        
+        # Start hardware detection on the background workers
+        future = self.executor.submit(self._detect_hardware_worker)
+        future.add_done_callback(self._detect_hardware_done)
+    
+    def _detect_hardware_worker(self):
+        """Hardware detection, run on a background thread."""
+        # Simulate hardware detection
+        return get_system_info()
+    
+    def _detect_hardware_done(self, future):
+        """Hand the hardware detection result to the main thread."""
+        error = future.exception()
+        if error is not None:
+            self.root.after(0, self._show_hardware_error, str(error))
+        else:
+            self.root.after(0, self._update_hardware_info, future.result())
+    
+    def _update_hardware_info(self, system_info):
+        """Update the hardware info text widget."""
+        self.hw_info.delete(1.0, tk.END)
+        self.hw_info.insert(tk.END, "Hardware Detection Results:\n\n")
+        
+        for key, value in system_info.items():
+            self.hw_info.insert(tk.END, f"{key}: {value}\n")
+        
+        # Add some simulated hardware detection results
+        self.hw_info.insert(tk.END, "\nDetected Components:\n")
+        self.hw_info.insert(tk.END, "- CPU: Intel Core i9-12900K (Alder Lake) ✓\n")
+        self.hw_info.insert(tk.END, "- GPU: NVIDIA GeForce GTX 970 ✓\n")
+        self.hw_info.insert(tk.END, "- RAM: 32GB DDR4 ✓\n")
+        self.hw_info.insert(tk.END, "- Storage: NVMe SSD 1TB ✓\n")
+        
+        self.hw_info.insert(tk.END, "\nCompatibility Status: Compatible ✓\n")
+        self.hw_info.config(state=tk.DISABLED)
+    
+    def _show_hardware_error(self, error_message):
+        """Show hardware detection error."""
+        self.hw_info.delete(1.0, tk.END)
+        self.hw_info.insert(tk.END, f"Error detecting hardware: {error_message}")
+        self.hw_info.config(state=tk.DISABLED)
+    
+    def select_usb_device(self):
+        """Select a USB device for the installer."""
+        # In a real implementation, this would show a list of available USB devices
+        # For this demo, we'll just use a simulated selection
+        messagebox.showinfo("Select USB Device", "This would show a list of available USB devices.")
+        self.usb_label.config(text="/dev/disk2 (USB Drive, 16GB)")
+    
+    def create_bootable_installer(self):
+        """Create a bootable installer."""
+        # Check if a USB device is selected
+        if self.usb_label.cget("text") == "No device selected":
+            messagebox.showerror("Error", "Please select a USB device first.")
+            return
+        
+        # Confirm with the user
+        result = messagebox.askyesno(
+            "Create Bootable Installer",
+            f"This will erase all data on {self.usb_label.cget('text')}. Continue?"
+        )
+        if result:
+            # In a real implementation, this would call the bootable installer creation functionality
+            messagebox.showinfo("Bootable Installer", "Creating bootable installer. This may take a while.")
+    
+    def apply_patches(self):
+        """Apply selected patches."""
+        # Build a list of selected patches
+        selected_patches = []
+        if self.nvidia_patch.get():
+            selected_patches.append("NVIDIA GTX 970 Acceleration")
+        if self.arc_patch.get():
+            selected_patches.append("Intel Arc A770 Acceleration")
+        if self.alder_lake_patch.get():
+            selected_patches.append("Alder Lake Support")
+        if self.raptor_lake_patch.get():
+            selected_patches.append("Raptor Lake Support")
+        
+        if not selected_patches:
+            messagebox.showerror("Error", "No patches selected.")
+            return
+        
+        # Confirm with the user
+        patches_text = "\n".join([f"- {patch}" for patch in selected_patches])
+        result = messagebox.askyesno(
+            "Apply Patches",
+            f"The following patches will be applied:\n\n{patches_text}\n\nContinue?"
+        )
+        if result:
+            # In a real implementation, this would call the patch application functionality
+            messagebox.showinfo("Patches", "Applying patches. This may take a while.")
+    
+    def check_sip_status(self):
+        """Check the SIP status."""
+        if not IS_MAC:
+            self.sip_status.set("Not applicable (not macOS)")
+            return
+        
+        try:
+            if "disabled" in get_sip_status().lower():
+                self.sip_status.set("Disabled ✓")
+            else:
+                self.sip_status.set("Enabled ✗")
+        except Exception as e:
+            self.sip_status.set(f"Error: {e}")
+    
+    def toggle_debug(self):
+        """Toggle debug logging."""
+        if self.debug_enabled.get():
+            messagebox.showinfo("Debug Logging", "Debug logging enabled.")
+        else:
+            messagebox.showinfo("Debug Logging", "Debug logging disabled.")
+    
+    def apply_advanced_settings(self):
+        """Apply advanced settings."""
+        boot_args = self.bootargs_entry.get().strip()
+        
+        if not boot_args:
+            messagebox.showerror("Error", "Boot arguments cannot be empty.")
+            return
+        
+        # Confirm with the user
+        result = messagebox.askyesno(
+            "Apply Advanced Settings",
+            f"The following boot arguments will be applied:\n\n{boot_args}\n\nContinue?"
+        )
+        if result:
+            # In a real implementation, this would apply the boot arguments
+            messagebox.showinfo("Advanced Settings", "Advanced settings applied successfully.")
+
+def main():
+    """Main entry point for the application."""
+    root = create_themed_app()
+    app = SkyscopeApp(root)
+    root.mainloop()
+    app.executor.shutdown(wait=False)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# -*- mode: python ; coding: utf-8 -*-
+#
+# PyInstaller spec for the macOS .app built by build_universal_apps.py.
+# Values that change between builds (paths, version, architecture) are read
+# from the JSON file named by SKYSCOPE_SPEC_VARS, so this file stays the same.
+
+import json
+import os
+from pathlib import Path
+
+VARS = json.loads(Path(os.environ["SKYSCOPE_SPEC_VARS"]).read_text())
+
+block_cipher = None
+
+a = Analysis(
+    [VARS["main_script"]],
+    pathex=[VARS["project_root"]],
+    binaries=[],
+    datas=[tuple(data) for data in VARS["datas"]],
+    hiddenimports=[
+        'wx',
+        'wx.lib.agw.aui',
+        'wx.lib.scrolledpanel',
+        'plistlib',
+        'zipfile',
+        'tempfile',
+        'threading',
+        'json',
+        'logging',
+        'subprocess',
+        'pathlib',
+        'dataclasses',
+        'typing',
+    ],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=[],
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    cipher=block_cipher,
+    noarchive=False,
+)
+
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+
+# No UPX: it compresses every binary serially at build time, forces each one
+# to be unpacked into private memory at launch, and packed Mach-O files
+# fail code signature validation. Stripping recovers size without that cost.
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name=VARS["app_name"],
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=True,
+    upx=False,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=VARS["target_arch"],
+    codesign_identity=None,
+    entitlements_file=None,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=True,
+    upx=False,
+    name=VARS["app_name"],
+)
+
+app = BUNDLE(
+    coll,
+    name=f'{VARS["app_name"]}.app',
+    icon=VARS["icon"],
+    bundle_identifier=VARS["bundle_id"],
+    version=VARS["version"],
+    info_plist=VARS["info_plist"],
+)